@@ -4,11 +4,6 @@ Entry point for the refactored Hyperliquid position monitoring application.
 
 import asyncio
 import sys
-from pathlib import Path
-
-# Add src directory to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
 
 from src.main import main
 
@@ -3,5 +3,6 @@ Bot components for handling user interactions.
 """
 
 from .telegram_bot import TelegramBot
+from .webhook_bot import WebhookBot
 
-__all__ = ['TelegramBot']
+__all__ = ['TelegramBot', 'WebhookBot']
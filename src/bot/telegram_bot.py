@@ -2,15 +2,28 @@
 Telegram bot for handling user commands and interactions.
 """
 
+from __future__ import annotations
+
 import asyncio
 import logging
-from typing import Dict, List, Optional
+import random
+
+import aiohttp
 
 from ..config.settings import Settings
 from ..services.telegram_service import TelegramService
 from ..services.position_service import PositionService
 from ..formatters.telegram_formatter import TelegramFormatter
 
+# Backoff between failed polls (seconds), plus up to 1s of random jitter
+POLL_BACKOFF_BASE = 0.5
+POLL_BACKOFF_MAX = 30
+
+_UNKNOWN_CMD_TEMPLATE = (
+    "❓ Unknown command: `%s`\n\n"
+    "Use /help to see available commands or /menu for the interactive menu."
+)
+
 
 class TelegramBot:
     """Telegram bot for handling user interactions."""
@@ -28,6 +41,17 @@ class TelegramBot:
         self.last_update_id = 0
         self.running = False
         
+        # Error formatting is used on every failure path, resolve it once
+        self._fmt_error = TelegramFormatter.format_error_message
+        
+        # Only updates from the configured chat are handled
+        self._allowed_chat_id = str(settings.telegram_chat_id)
+        
+        # One queue and worker task per chat: chats are served concurrently,
+        # updates within a chat keep their order
+        self._chat_queues: dict[int, asyncio.Queue] = {}
+        self._chat_workers: dict[int, asyncio.Task] = {}
+        
         # Command handlers
         self.command_handlers = {
             '/start': self._handle_start,
@@ -45,33 +69,100 @@ class TelegramBot:
         self.running = True
         self.logger.info("🤖 Telegram bot started, listening for commands...")
         
+        failures = 0
         while self.running:
             try:
                 await self._poll_updates()
-                await asyncio.sleep(1)  # Small delay between polls
+                failures = 0
+                # Long polling already waits server-side, just yield to the loop
+                await asyncio.sleep(0)
                 
             except asyncio.CancelledError:
                 self.logger.info("🛑 Telegram bot polling cancelled")
+                self._cancel_workers()
                 break
-            except Exception as e:
-                self.logger.error(f"❌ Error in bot polling: {e}")
-                await asyncio.sleep(5)  # Wait before retrying
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                failures += 1
+                delay = self._poll_backoff(failures)
+                self.logger.warning(f"⚠️ Telegram polling failed, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+            except Exception:
+                # Not a network problem: keep the traceback so the bug is visible
+                self.logger.exception("❌ Unexpected error in bot polling")
+                failures += 1
+                await asyncio.sleep(self._poll_backoff(failures))
+    
+    @staticmethod
+    def _poll_backoff(failures: int) -> float:
+        """Exponential backoff with jitter between failed polls."""
+        return min(POLL_BACKOFF_MAX, POLL_BACKOFF_BASE * 2 ** (failures - 1)) + random.random()
     
     async def stop(self) -> None:
         """Stop the Telegram bot."""
         self.running = False
+        self._cancel_workers()
         self.logger.info("🛑 Telegram bot stopped")
     
     async def _poll_updates(self) -> None:
         """Poll for new updates from Telegram."""
-        updates = self.telegram_service.get_updates(
-            offset=self.last_update_id + 1,
-            timeout=10
+        updates = await self.telegram_service.get_updates_async(
+            offset=self.last_update_id + 1
         )
         
         for update in updates:
+            # Advance the offset on enqueue so the next poll starts immediately
             self.last_update_id = update.get('update_id', 0)
-            await self._process_update(update)
+            self._dispatch_update(update)
+    
+    def _dispatch_update(self, update: dict) -> None:
+        """Queue an update on its chat's worker, starting the worker if needed."""
+        chat_id = self._get_update_chat_id(update)
+        
+        # Updates without a message or callback chat (e.g. edited messages) are ignored
+        if chat_id is None:
+            return
+        
+        # Drop other chats here so they never get a queue or worker of their own
+        if str(chat_id) != self._allowed_chat_id:
+            self.logger.warning(f"⚠️ Unauthorized chat ID: {chat_id}")
+            return
+        
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = asyncio.Queue()
+            self._chat_workers[chat_id] = asyncio.create_task(self._chat_worker(chat_id, queue))
+        queue.put_nowait(update)
+    
+    @staticmethod
+    def _get_update_chat_id(update: dict) -> int | None:
+        """Extract the chat ID from a message or callback query update."""
+        if 'message' in update:
+            return update['message'].get('chat', {}).get('id')
+        if 'callback_query' in update:
+            return update['callback_query'].get('message', {}).get('chat', {}).get('id')
+        return None
+    
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue) -> None:
+        """Process one chat's updates in arrival order, exiting once the queue drains."""
+        try:
+            while not queue.empty():
+                update = queue.get_nowait()
+                try:
+                    await self._process_update(update)
+                finally:
+                    queue.task_done()
+        finally:
+            # The next update for this chat starts a fresh worker
+            if self._chat_queues.get(chat_id) is queue:
+                del self._chat_queues[chat_id]
+                del self._chat_workers[chat_id]
+    
+    def _cancel_workers(self) -> None:
+        """Cancel all per-chat worker tasks."""
+        for task in self._chat_workers.values():
+            task.cancel()
+        self._chat_workers.clear()
+        self._chat_queues.clear()
     
     async def _process_update(self, update: dict) -> None:
         """Process a single update from Telegram."""
@@ -95,7 +186,7 @@ class TelegramBot:
         chat_id = message.get('chat', {}).get('id')
         
         # Verify chat ID matches configured chat
-        if str(chat_id) != str(self.settings.telegram_chat_id):
+        if str(chat_id) != self._allowed_chat_id:
             self.logger.warning(f"⚠️ Unauthorized chat ID: {chat_id}")
             return
         
@@ -103,9 +194,11 @@ class TelegramBot:
         
         # Handle commands
         if text.startswith('/'):
-            command = text.split()[0].lower()
-            if command in self.command_handlers:
-                await self.command_handlers[command]()
+            # Handler keys are lowercase; split once on any whitespace (spaces,
+            # tabs, newlines) rather than tokenizing the whole message
+            handler = self.command_handlers.get(text.split(None, 1)[0].lower())
+            if handler is not None:
+                await self._run_command(handler)
             else:
                 await self._handle_unknown_command(text)
         else:
@@ -120,43 +213,53 @@ class TelegramBot:
         self.logger.info(f"🔘 Received callback: {callback_data}")
         
         # Answer the callback query to remove loading state
-        self.telegram_service.answer_callback_query(callback_query_id)
+        await self.telegram_service.answer_callback_query_async(callback_query_id)
         
         # Handle the callback as a command
         if callback_data.startswith('/'):
-            command = callback_data.lower()
-            if command in self.command_handlers:
-                await self.command_handlers[command]()
+            handler = self.command_handlers.get(callback_data.lower())
+            if handler is not None:
+                await self._run_command(handler)
             else:
                 await self._handle_unknown_command(callback_data)
     
+    async def _run_command(self, handler) -> None:
+        """Run a command handler, cancelling it if it outlives the API timeout."""
+        try:
+            await asyncio.wait_for(handler(), timeout=self.settings.api_timeout + 5)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"⏱️ Command handler {handler.__name__} timed out")
+            await self.telegram_service.send_message_async(
+                self._fmt_error('timeout', 'The command did not complete in time')
+            )
+    
     async def _handle_start(self) -> None:
         """Handle /start command."""
         await self._handle_menu()
     
     async def _handle_menu(self) -> None:
         """Handle /menu command - show inline keyboard."""
-        success = self.telegram_service.send_command_menu()
+        success = await self.telegram_service.send_command_menu_async()
         if not success:
-            error_msg = TelegramFormatter.format_error_message(
+            error_msg = self._fmt_error(
                 'network_error', 
                 'Failed to send menu'
             )
-            self.telegram_service.send_message(error_msg)
+            await self.telegram_service.send_message_async(error_msg)
     
     async def _handle_help(self) -> None:
         """Handle /help command."""
-        success = self.telegram_service.send_help_message(
+        success = await self.telegram_service.send_help_message_async(
             self.settings.price_symbols,
             self.settings.refresh_interval
         )
         
         if not success:
-            error_msg = TelegramFormatter.format_error_message(
+            error_msg = self._fmt_error(
                 'network_error', 
                 'Failed to send help message'
             )
-            self.telegram_service.send_message(error_msg)
+            await self.telegram_service.send_message_async(error_msg)
     
     async def _handle_position(self) -> None:
         """Handle /position command."""
@@ -164,17 +267,17 @@ class TelegramBot:
             self.logger.info("📊 Processing position command...")
             
             # Get positions and account data
-            positions, account_summary = self.position_service.get_positions_and_account(
+            positions, account_summary = await self.position_service.get_positions_and_account_async(
                 use_cache=True, 
                 force_refresh=False
             )
             
             if positions is None or account_summary is None:
-                error_msg = TelegramFormatter.format_error_message(
+                error_msg = self._fmt_error(
                     'api_error',
                     'Failed to fetch position data'
                 )
-                self.telegram_service.send_message(error_msg)
+                await self.telegram_service.send_message_async(error_msg)
                 return
             
             # Calculate portfolio metrics
@@ -187,21 +290,21 @@ class TelegramBot:
                 positions, account_summary, portfolio_metrics
             )
             
-            success = self.telegram_service.send_message(message)
+            success = await self.telegram_service.send_message_async(message)
             if not success:
-                error_msg = TelegramFormatter.format_error_message(
+                error_msg = self._fmt_error(
                     'network_error',
                     'Failed to send position data'
                 )
-                self.telegram_service.send_message(error_msg)
+                await self.telegram_service.send_message_async(error_msg)
             
         except Exception as e:
             self.logger.error(f"❌ Error handling position command: {e}")
-            error_msg = TelegramFormatter.format_error_message(
+            error_msg = self._fmt_error(
                 'unknown_error',
                 str(e)
             )
-            self.telegram_service.send_message(error_msg)
+            await self.telegram_service.send_message_async(error_msg)
     
     async def _handle_prices(self) -> None:
         """Handle /prices command."""
@@ -209,32 +312,42 @@ class TelegramBot:
             self.logger.info("📈 Processing prices command...")
             
             # Get price data
-            price_collection = self.position_service.get_prices(
+            price_collection = await asyncio.to_thread(
+                self.position_service.get_prices,
                 symbols=self.settings.price_symbols,
                 use_cache=True,
                 force_refresh=False
             )
             
+            # Nothing to format when the price fetch failed
+            if not price_collection:
+                error_msg = self._fmt_error(
+                    'api_error',
+                    'Failed to fetch price data'
+                )
+                await self.telegram_service.send_message_async(error_msg)
+                return
+            
             # Format and send message
             message = TelegramFormatter.format_prices_message(
                 price_collection, self.settings.price_symbols
             )
             
-            success = self.telegram_service.send_message(message)
+            success = await self.telegram_service.send_message_async(message)
             if not success:
-                error_msg = TelegramFormatter.format_error_message(
+                error_msg = self._fmt_error(
                     'network_error',
                     'Failed to send price data'
                 )
-                self.telegram_service.send_message(error_msg)
+                await self.telegram_service.send_message_async(error_msg)
             
         except Exception as e:
             self.logger.error(f"❌ Error handling prices command: {e}")
-            error_msg = TelegramFormatter.format_error_message(
+            error_msg = self._fmt_error(
                 'unknown_error',
                 str(e)
             )
-            self.telegram_service.send_message(error_msg)
+            await self.telegram_service.send_message_async(error_msg)
     
     async def _handle_fills(self) -> None:
         """Handle /fills command."""
@@ -242,7 +355,8 @@ class TelegramBot:
             self.logger.info("📑 Processing fills command...")
             
             # Get fills data
-            fills = self.position_service.get_user_fills(
+            fills = await asyncio.to_thread(
+                self.position_service.get_user_fills,
                 limit=10,
                 use_cache=False,  # Always fetch fresh fills
                 force_refresh=True
@@ -251,21 +365,21 @@ class TelegramBot:
             # Format and send message
             message = TelegramFormatter.format_fills_message(fills)
             
-            success = self.telegram_service.send_message(message)
+            success = await self.telegram_service.send_message_async(message)
             if not success:
-                error_msg = TelegramFormatter.format_error_message(
+                error_msg = self._fmt_error(
                     'network_error',
                     'Failed to send fills data'
                 )
-                self.telegram_service.send_message(error_msg)
+                await self.telegram_service.send_message_async(error_msg)
             
         except Exception as e:
             self.logger.error(f"❌ Error handling fills command: {e}")
-            error_msg = TelegramFormatter.format_error_message(
+            error_msg = self._fmt_error(
                 'unknown_error',
                 str(e)
             )
-            self.telegram_service.send_message(error_msg)
+            await self.telegram_service.send_message_async(error_msg)
     
     async def _handle_openorders(self) -> None:
         """Handle /openorders command."""
@@ -273,7 +387,8 @@ class TelegramBot:
             self.logger.info("🧾 Processing open orders command...")
             
             # Get orders data
-            orders = self.position_service.get_open_orders(
+            orders = await asyncio.to_thread(
+                self.position_service.get_open_orders,
                 limit=10,
                 use_cache=False,  # Always fetch fresh orders
                 force_refresh=True
@@ -282,30 +397,32 @@ class TelegramBot:
             # Format and send message
             message = TelegramFormatter.format_orders_message(orders)
             
-            success = self.telegram_service.send_message(message)
+            success = await self.telegram_service.send_message_async(message)
             if not success:
-                error_msg = TelegramFormatter.format_error_message(
+                error_msg = self._fmt_error(
                     'network_error',
                     'Failed to send orders data'
                 )
-                self.telegram_service.send_message(error_msg)
+                await self.telegram_service.send_message_async(error_msg)
             
         except Exception as e:
             self.logger.error(f"❌ Error handling orders command: {e}")
-            error_msg = TelegramFormatter.format_error_message(
+            error_msg = self._fmt_error(
                 'unknown_error',
                 str(e)
             )
-            self.telegram_service.send_message(error_msg)
+            await self.telegram_service.send_message_async(error_msg)
     
     async def _handle_status(self) -> None:
         """Handle /status command."""
         try:
             self.logger.info("🔧 Processing status command...")
             
-            # Test connectivity
-            api_connected = self.position_service.api_service.test_connectivity()
-            telegram_connected = self.telegram_service.test_connectivity()
+            # Test connectivity to both APIs concurrently
+            api_connected, telegram_connected = await asyncio.gather(
+                self.position_service.api_service.test_connectivity_async(),
+                self.telegram_service.test_connectivity_async()
+            )
             
             # Get cache stats
             cache_stats = self.position_service.get_cache_stats()
@@ -318,26 +435,25 @@ class TelegramBot:
                 api_connected, telegram_connected, cache_stats, uptime_seconds
             )
             
-            success = self.telegram_service.send_message(message)
+            success = await self.telegram_service.send_message_async(message)
             if not success:
-                error_msg = TelegramFormatter.format_error_message(
+                error_msg = self._fmt_error(
                     'network_error',
                     'Failed to send status data'
                 )
-                self.telegram_service.send_message(error_msg)
+                await self.telegram_service.send_message_async(error_msg)
             
         except Exception as e:
             self.logger.error(f"❌ Error handling status command: {e}")
-            error_msg = TelegramFormatter.format_error_message(
+            error_msg = self._fmt_error(
                 'unknown_error',
                 str(e)
             )
-            self.telegram_service.send_message(error_msg)
+            await self.telegram_service.send_message_async(error_msg)
     
     async def _handle_unknown_command(self, command: str) -> None:
         """Handle unknown commands."""
-        message = f"❓ Unknown command: `{command}`\n\nUse /help to see available commands or /menu for the interactive menu."
-        self.telegram_service.send_message(message)
+        await self.telegram_service.send_message_async(_UNKNOWN_CMD_TEMPLATE % command)
     
     async def _handle_text_message(self, text: str) -> None:
         """Handle non-command text messages."""
@@ -0,0 +1,108 @@
+"""
+Telegram bot that receives updates through a webhook instead of polling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+from urllib.parse import urlparse
+
+import orjson
+from aiohttp import web
+
+from .telegram_bot import TelegramBot
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+# Attempts at registering the webhook before the bot gives up
+WEBHOOK_REGISTER_ATTEMPTS = 5
+
+
+class WebhookBot(TelegramBot):
+    """Telegram bot served by an aiohttp webhook endpoint."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stopped: asyncio.Event | None = None
+    
+    async def start(self) -> None:
+        """Start the webhook server and register it with Telegram."""
+        self.running = True
+        self._stopped = asyncio.Event()
+        
+        webhook_url = self.settings.telegram_webhook_url
+        app = web.Application()
+        app.router.add_post(urlparse(webhook_url).path or "/", self._handle_webhook)
+        
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(
+            runner,
+            self.settings.telegram_webhook_host,
+            self.settings.telegram_webhook_port
+        )
+        
+        try:
+            await site.start()
+            await self._register_webhook(webhook_url)
+            
+            self.logger.info(
+                f"🤖 Telegram bot started, listening for webhook updates on "
+                f"{self.settings.telegram_webhook_host}:{self.settings.telegram_webhook_port}"
+            )
+            await self._stopped.wait()
+            
+        except asyncio.CancelledError:
+            self.logger.info("🛑 Telegram webhook bot cancelled")
+        finally:
+            self._cancel_workers()
+            await asyncio.to_thread(self.telegram_service.delete_webhook)
+            await runner.cleanup()
+    
+    async def _register_webhook(self, webhook_url: str) -> None:
+        """Point Telegram at the webhook, retrying with backoff before giving up."""
+        for attempt in range(1, WEBHOOK_REGISTER_ATTEMPTS + 1):
+            registered = await asyncio.to_thread(
+                self.telegram_service.set_webhook,
+                webhook_url,
+                self.settings.telegram_webhook_secret
+            )
+            if registered:
+                return
+            if attempt < WEBHOOK_REGISTER_ATTEMPTS:
+                delay = self._poll_backoff(attempt)
+                self.logger.warning(f"⚠️ Failed to register Telegram webhook, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        
+        # Without a webhook no commands arrive, so fail the bot task instead of idling
+        raise RuntimeError(
+            f"Failed to register Telegram webhook after {WEBHOOK_REGISTER_ATTEMPTS} attempts"
+        )
+    
+    async def stop(self) -> None:
+        """Stop the webhook bot."""
+        await super().stop()
+        if self._stopped is not None:
+            self._stopped.set()
+    
+    async def _handle_webhook(self, request: web.Request) -> web.Response:
+        """Accept one update pushed by Telegram and queue it for processing."""
+        # Without a secret nothing proves the request came from Telegram
+        secret = self.settings.telegram_webhook_secret
+        if not secret or not hmac.compare_digest(
+            request.headers.get(SECRET_TOKEN_HEADER, ""), secret
+        ):
+            self.logger.warning("⚠️ Rejected webhook request with invalid secret token")
+            return web.Response(status=403)
+        
+        try:
+            update = orjson.loads(await request.read())
+        except orjson.JSONDecodeError:
+            return web.Response(status=400)
+        if not isinstance(update, dict):
+            return web.Response(status=400)
+        
+        # Reply right away; Telegram retries updates that are not acknowledged
+        self._dispatch_update(update)
+        return web.Response()
@@ -2,14 +2,36 @@
 Environment configuration validation and setup.
 """
 
+from __future__ import annotations
+
 import os
 import sys
 from pathlib import Path
-from typing import List, Dict, Any
-from rich.console import Console
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# rich and python-dotenv are only needed during startup validation,
+# so they are imported on first use rather than with the config package
+_console: Console | None = None
+
+
+def _get_console() -> Console:
+    """Get the shared rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
-console = Console()
+# Value prefixes that mark a variable as still holding template text
+PLACEHOLDER_PREFIXES = ('your_', 'YOUR_', 'example_', 'EXAMPLE_')
+
+
+def parse_symbols(value: str) -> tuple[str, ...]:
+    """Parse a comma-separated symbol list, ignoring blanks."""
+    return tuple(s for s in (part.strip() for part in value.split(',')) if s)
 
 
 class EnvironmentConfig:
@@ -25,25 +47,46 @@ class EnvironmentConfig:
         self.optional_vars = {
             'REFRESH_INTERVAL_SECONDS': '300',
             'PRICE_SYMBOLS': 'BTC,ETH,SOL',
+            'BOOT_STAGGER_SECONDS': '0',
+            'CONSOLE_OUTPUT': '',
             'API_TIMEOUT': '30',
             'CACHE_DURATION': '30',
             'LOG_LEVEL': 'INFO',
-            'LOG_DIRECTORY': 'logs'
+            'LOG_DIRECTORY': 'logs',
+            'TELEGRAM_WEBHOOK_URL': '',
+            'TELEGRAM_WEBHOOK_HOST': '0.0.0.0',
+            'TELEGRAM_WEBHOOK_PORT': '8443',
+            'TELEGRAM_WEBHOOK_SECRET': ''
         }
         
+        # Parsed .env contents, read once by load_environment
+        self.env_file_values: dict[str, str | None] = {}
+        
         # Load environment variables from .env file
         self.load_environment()
+        
+        # Parsed once here and shared with Settings.from_env
+        self.price_symbols = parse_symbols(
+            os.getenv('PRICE_SYMBOLS', self.optional_vars['PRICE_SYMBOLS'])
+        )
     
     def load_environment(self) -> bool:
         """Load environment variables from .env file."""
         env_file = Path(".env")
         
         if env_file.exists():
-            load_dotenv(env_file)
-            console.print("📄 [bold green]Environment variables loaded from .env file[/bold green]")
+            from dotenv import dotenv_values
+            
+            # Parse once; check_env_file validates the same values later
+            self.env_file_values = dotenv_values(env_file)
+            for key, value in self.env_file_values.items():
+                # Like load_dotenv: existing environment variables take precedence
+                if value is not None:
+                    os.environ.setdefault(key, value)
+            _get_console().print("📄 [bold green]Environment variables loaded from .env file[/bold green]")
             return True
         else:
-            console.print("⚠️ [bold yellow].env file not found, using system environment variables[/bold yellow]")
+            _get_console().print("⚠️ [bold yellow].env file not found, using system environment variables[/bold yellow]")
             return False
     
     def validate_environment(self) -> bool:
@@ -52,17 +95,17 @@ class EnvironmentConfig:
         
         for var in self.required_vars:
             value = os.getenv(var)
-            if not value or value.startswith('your_'):
+            if not value or value.startswith(PLACEHOLDER_PREFIXES):
                 missing_vars.append(var)
         
         if missing_vars:
-            console.print("❌ [bold red]Missing or incomplete environment variables:[/bold red]")
+            _get_console().print("❌ [bold red]Missing or incomplete environment variables:[/bold red]")
             for var in missing_vars:
-                console.print(f"  • {var}")
-            console.print("\n📝 Please update your .env file with actual values")
+                _get_console().print(f"  • {var}")
+            _get_console().print("\n📝 Please update your .env file with actual values")
             return False
         
-        console.print("✅ [bold green]Environment variables validated successfully[/bold green]")
+        _get_console().print("✅ [bold green]Environment variables validated successfully[/bold green]")
         return True
     
     def check_env_file(self) -> bool:
@@ -70,42 +113,32 @@ class EnvironmentConfig:
         env_file = Path(".env")
         
         if not env_file.exists():
-            console.print("❌ [bold red].env file not found[/bold red]")
-            console.print("📝 Please create .env file using .env.example as template")
+            _get_console().print("❌ [bold red].env file not found[/bold red]")
+            _get_console().print("📝 Please create .env file using .env.example as template")
             return False
         
-        try:
-            with open(env_file, 'r') as f:
-                content = f.read()
+        values = self.env_file_values
+        
+        for var in self.required_vars:
+            if var not in values:
+                _get_console().print(f"❌ [bold red]Missing {var} in .env file[/bold red]")
+                return False
             
             # Check for placeholder values
-            placeholder_patterns = ['your_', 'YOUR_', 'example_', 'EXAMPLE_']
-            
-            for var in self.required_vars:
-                if f"{var}=" not in content:
-                    console.print(f"❌ [bold red]Missing {var} in .env file[/bold red]")
-                    return False
-                
-                # Check for placeholder values
-                for pattern in placeholder_patterns:
-                    if f"{var}={pattern}" in content:
-                        console.print(f"❌ [bold red]{var} contains placeholder value[/bold red]")
-                        return False
-            
-            console.print("✅ [bold green].env file validated successfully[/bold green]")
-            return True
-            
-        except Exception as e:
-            console.print(f"❌ [bold red]Error reading .env file: {e}[/bold red]")
-            return False
+            if (values[var] or '').startswith(PLACEHOLDER_PREFIXES):
+                _get_console().print(f"❌ [bold red]{var} contains placeholder value[/bold red]")
+                return False
+        
+        _get_console().print("✅ [bold green].env file validated successfully[/bold green]")
+        return True
     
     def setup_directories(self) -> None:
         """Create necessary directories."""
         log_dir = Path(os.getenv('LOG_DIRECTORY', 'logs'))
         log_dir.mkdir(exist_ok=True)
-        console.print(f"📁 Log directory ready: {log_dir}")
+        _get_console().print(f"📁 Log directory ready: {log_dir}")
     
-    def get_environment_info(self) -> Dict[str, Any]:
+    def get_environment_info(self) -> dict[str, Any]:
         """Get current environment information."""
         return {
             'python_version': sys.version,
@@ -113,24 +146,24 @@ class EnvironmentConfig:
             'working_directory': os.getcwd(),
             'env_file_exists': Path('.env').exists(),
             'log_directory': os.getenv('LOG_DIRECTORY', 'logs'),
-            'configured_symbols': os.getenv('PRICE_SYMBOLS', 'BTC,ETH,SOL').split(',')
+            'configured_symbols': self.price_symbols
         }
     
     def print_environment_summary(self) -> None:
         """Print environment configuration summary."""
         info = self.get_environment_info()
         
-        console.print("\n📊 [bold blue]Environment Summary[/bold blue]")
-        console.print(f"• Python Version: {info['python_version'].split()[0]}")
-        console.print(f"• Platform: {info['platform']}")
-        console.print(f"• Working Directory: {info['working_directory']}")
-        console.print(f"• Environment File: {'✅ Found' if info['env_file_exists'] else '❌ Missing'}")
-        console.print(f"• Log Directory: {info['log_directory']}")
-        console.print(f"• Price Symbols: {', '.join(info['configured_symbols'])}")
+        _get_console().print("\n📊 [bold blue]Environment Summary[/bold blue]")
+        _get_console().print(f"• Python Version: {info['python_version'].split()[0]}")
+        _get_console().print(f"• Platform: {info['platform']}")
+        _get_console().print(f"• Working Directory: {info['working_directory']}")
+        _get_console().print(f"• Environment File: {'✅ Found' if info['env_file_exists'] else '❌ Missing'}")
+        _get_console().print(f"• Log Directory: {info['log_directory']}")
+        _get_console().print(f"• Price Symbols: {', '.join(info['configured_symbols'])}")
     
     def validate_all(self) -> bool:
         """Validate entire environment setup."""
-        console.print("🔍 [bold cyan]Validating Environment Configuration[/bold cyan]")
+        _get_console().print("🔍 [bold cyan]Validating Environment Configuration[/bold cyan]")
         
         # Check .env file
         if not self.check_env_file():
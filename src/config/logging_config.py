@@ -2,11 +2,17 @@
 Logging configuration for the Hyperliquid position monitor.
 """
 
+from __future__ import annotations
+
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
-from typing import Optional
+
+# Background thread that writes queued records to the real handlers
+_listener: logging.handlers.QueueListener | None = None
 
 
 def setup_logging(log_level: str = "INFO", log_directory: str = "logs") -> None:
@@ -35,17 +41,20 @@ def setup_logging(log_level: str = "INFO", log_directory: str = "logs") -> None:
         '%(levelname)s - %(message)s'
     )
     
-    # File handler with rotation (10MB max, keep 5 backups)
-    file_handler = logging.handlers.RotatingFileHandler(
+    # File handler rotated hourly (keep 7 days). Unlike size-based rotation
+    # it does not have to format every record twice to measure its length.
+    file_handler = logging.handlers.TimedRotatingFileHandler(
         filename=log_file,
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
+        when='H',
+        interval=1,
+        backupCount=168,
+        encoding='utf-8',
+        utc=True
     )
     file_handler.setFormatter(detailed_formatter)
     
-    # Console handler
-    console_handler = logging.StreamHandler()
+    # Console handler (colored by level when writing to a terminal)
+    console_handler = ColoredConsoleHandler()
     console_handler.setFormatter(simple_formatter)
     
     # Configure root logger
@@ -53,11 +62,18 @@ def setup_logging(log_level: str = "INFO", log_directory: str = "logs") -> None:
     root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     
     # Clear any existing handlers
+    shutdown_logging()
     root_logger.handlers.clear()
     
-    # Add handlers
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # Loggers only enqueue records; file and console writes happen on a
+    # listener thread so they never block the event loop
+    global _listener
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
     
     # Set specific logger levels
     logging.getLogger('urllib3').setLevel(logging.WARNING)
@@ -68,6 +84,20 @@ def setup_logging(log_level: str = "INFO", log_directory: str = "logs") -> None:
     logger.info(f"Logging initialized - Level: {log_level}, File: {log_file}")
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+# Also flush on exit paths that skip the application's shutdown (e.g. sys.exit)
+atexit.register(shutdown_logging)
+
+
 class ColoredConsoleHandler(logging.StreamHandler):
     """Console handler with colored output."""
     
@@ -81,15 +111,27 @@ class ColoredConsoleHandler(logging.StreamHandler):
     
     RESET = '\033[0m'
     
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        # Only emit ANSI codes when writing to a terminal
+        isatty = getattr(self.stream, 'isatty', None)
+        self._use_color = bool(isatty and isatty())
+        self._reset_terminator = self.RESET + self.terminator
+    
     def emit(self, record):
         """Emit a colored log record."""
+        if not self._use_color:
+            super().emit(record)
+            return
+        
         try:
             msg = self.format(record)
-            color = self.COLORS.get(record.levelname, '')
-            colored_msg = f"{color}{msg}{self.RESET}"
             
+            # Write the pieces separately instead of building a new string
             stream = self.stream
-            stream.write(colored_msg + self.terminator)
+            stream.write(self.COLORS.get(record.levelname, ''))
+            stream.write(msg)
+            stream.write(self._reset_terminator)
             self.flush()
         except Exception:
             self.handleError(record)
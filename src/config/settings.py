@@ -2,15 +2,22 @@
 Application settings and configuration management.
 """
 
+from __future__ import annotations
+
 import os
-from typing import List, Optional
-from dataclasses import dataclass
-from dotenv import load_dotenv
+import sys
+from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+
+from .environment import parse_symbols
+
+if TYPE_CHECKING:
+    from .environment import EnvironmentConfig
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application configuration settings."""
+    """Application configuration settings (immutable once loaded)."""
     
     # Hyperliquid Configuration
     wallet_address: str
@@ -19,9 +26,19 @@ class Settings:
     telegram_bot_token: str
     telegram_chat_id: str
     
+    # Telegram Webhook Configuration (updates are polled when no URL is set)
+    telegram_webhook_url: str | None = None
+    telegram_webhook_host: str = "0.0.0.0"
+    telegram_webhook_port: int = 8443
+    telegram_webhook_secret: str | None = None
+    
     # Application Configuration
     refresh_interval: int = 300
-    price_symbols: List[str] = None
+    price_symbols: tuple[str, ...] = ('BTC', 'ETH', 'SOL')
+    boot_stagger_seconds: int = 0
+    
+    # Console refresh output (off by default when stdout is not a terminal)
+    enable_console_output: bool = field(default_factory=sys.stdout.isatty)
     
     # API Configuration
     api_base_url: str = "https://api.hyperliquid.xyz/info"
@@ -34,15 +51,27 @@ class Settings:
     log_level: str = "INFO"
     log_directory: str = "logs"
     
+    # Derived values, computed once in __post_init__
+    _telegram_api_url: str = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
-        """Post-initialization processing."""
-        if self.price_symbols is None:
-            self.price_symbols = ['BTC', 'ETH', 'SOL']
+        """Precompute values derived from the immutable settings."""
+        object.__setattr__(
+            self, '_telegram_api_url', f"https://api.telegram.org/bot{self.telegram_bot_token}"
+        )
     
     @classmethod
-    def from_env(cls) -> 'Settings':
-        """Create settings from environment variables."""
-        load_dotenv()
+    def from_env(cls, env_config: EnvironmentConfig | None = None) -> Settings:
+        """
+        Create settings from environment variables.
+        
+        Args:
+            env_config: Already loaded environment; its .env values and parsed
+                symbols are reused instead of reading and parsing them again
+        """
+        if env_config is None:
+            from dotenv import load_dotenv
+            load_dotenv()
         
         # Required environment variables
         wallet_address = os.getenv('HL_WALLET_ADDRESS')
@@ -57,9 +86,22 @@ class Settings:
             raise ValueError("TELEGRAM_CHAT_ID environment variable is required")
         
         # Optional environment variables with defaults
+        telegram_webhook_url = os.getenv('TELEGRAM_WEBHOOK_URL') or None
+        telegram_webhook_host = os.getenv('TELEGRAM_WEBHOOK_HOST', '0.0.0.0')
+        telegram_webhook_port = int(os.getenv('TELEGRAM_WEBHOOK_PORT', 8443))
+        telegram_webhook_secret = os.getenv('TELEGRAM_WEBHOOK_SECRET') or None
+        
         refresh_interval = int(os.getenv('REFRESH_INTERVAL_SECONDS', 300))
-        price_symbols_str = os.getenv('PRICE_SYMBOLS', 'BTC,ETH,SOL')
-        price_symbols = [s.strip() for s in price_symbols_str.split(',') if s.strip()]
+        if env_config is not None:
+            price_symbols = env_config.price_symbols
+        else:
+            price_symbols = parse_symbols(os.getenv('PRICE_SYMBOLS', 'BTC,ETH,SOL'))
+        boot_stagger_seconds = int(os.getenv('BOOT_STAGGER_SECONDS', 0))
+        console_output = os.getenv('CONSOLE_OUTPUT', '').strip().lower()
+        if console_output:
+            enable_console_output = console_output in ('1', 'true', 'yes', 'on')
+        else:
+            enable_console_output = sys.stdout.isatty()
         
         api_timeout = int(os.getenv('API_TIMEOUT', 30))
         cache_duration = int(os.getenv('CACHE_DURATION', 30))
@@ -70,8 +112,14 @@ class Settings:
             wallet_address=wallet_address,
             telegram_bot_token=telegram_bot_token,
             telegram_chat_id=telegram_chat_id,
+            telegram_webhook_url=telegram_webhook_url,
+            telegram_webhook_host=telegram_webhook_host,
+            telegram_webhook_port=telegram_webhook_port,
+            telegram_webhook_secret=telegram_webhook_secret,
             refresh_interval=refresh_interval,
             price_symbols=price_symbols,
+            boot_stagger_seconds=boot_stagger_seconds,
+            enable_console_output=enable_console_output,
             api_timeout=api_timeout,
             cache_duration=cache_duration,
             log_level=log_level,
@@ -86,8 +134,14 @@ class Settings:
             raise ValueError("Telegram bot token cannot be empty")
         if not self.telegram_chat_id:
             raise ValueError("Telegram chat ID cannot be empty")
+        if self.telegram_webhook_url and not self.telegram_webhook_url.startswith("https://"):
+            raise ValueError("Telegram webhook URL must use HTTPS")
+        if self.telegram_webhook_url and not self.telegram_webhook_secret:
+            raise ValueError("Telegram webhook secret is required when a webhook URL is set")
         if self.refresh_interval < 1:
             raise ValueError("Refresh interval must be at least 1 second")
+        if self.boot_stagger_seconds < 0:
+            raise ValueError("Boot stagger cannot be negative")
         if self.api_timeout < 1:
             raise ValueError("API timeout must be at least 1 second")
         if not self.price_symbols:
@@ -96,4 +150,4 @@ class Settings:
     @property
     def telegram_api_url(self) -> str:
         """Get Telegram API URL."""
-        return f"https://api.telegram.org/bot{self.telegram_bot_token}"
+        return self._telegram_api_url
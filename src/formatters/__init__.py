@@ -3,6 +3,6 @@ Message formatters for different output formats.
 """
 
 from .telegram_formatter import TelegramFormatter
-from .console_formatter import ConsoleFormatter
+from .console_formatter import ConsoleFormatter, PlainConsoleFormatter, get_console_formatter
 
-__all__ = ['TelegramFormatter', 'ConsoleFormatter']
+__all__ = ['TelegramFormatter', 'ConsoleFormatter', 'PlainConsoleFormatter', 'get_console_formatter']
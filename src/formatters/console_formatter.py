@@ -3,10 +3,13 @@ Console formatter for position and trading data with rich formatting.
 """
 
 from typing import List, Optional
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from operator import attrgetter, itemgetter
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.style import Style
 from rich.text import Text
 from rich.columns import Columns
 
@@ -14,13 +17,172 @@ from ..models.position import Position
 from ..models.account import AccountSummary
 from ..models.order import Order, OrderFill
 from ..models.price import PriceCollection
+from .timestamps import hms_now
+
+# Styles for per-row table cells, built once so hot rows skip the markup parser
+_ROW_COLORS = (
+    "bright_green", "bright_red", "bright_yellow",
+    "bright_cyan", "bright_magenta", "bright_white"
+)
+STYLES = {color: Style(color=color) for color in _ROW_COLORS}
+BOLD_STYLES = {color: Style(bold=True, color=color) for color in _ROW_COLORS}
+DIM_STYLE = Style(dim=True)
+TABLE_TITLE_STYLE = Style(bold=True, italic=True, color="bright_cyan")
+
+ERROR_MESSAGES = {
+    'api_error': '🚫 API Error: Failed to fetch data from Hyperliquid API.',
+    'network_error': '🌐 Network Error: Connection issue detected.',
+    'data_error': '📊 Data Error: Invalid or missing data received.',
+    'auth_error': '🔐 Authentication Error: Invalid credentials or permissions.',
+    'rate_limit': '⏱️ Rate Limited: Too many requests. Please wait.',
+    'unknown_error': '❓ Unknown Error: An unexpected error occurred.'
+}
+ERROR_FOOTER = "💡 Try again in a few moments or contact support if the issue persists."
+
+SEPARATOR = "─" * 80
+
+# Shared console; every cell is styled explicitly, so skip the repr highlighter
+# and the markup/emoji-code parsers (panel titles still accept markup)
+_CONSOLE = Console(highlight=False, markup=False, emoji=False)
+
+_pnl_key = attrgetter("unrealized_pnl")
+
+# Tables with more rows than this drop the separator line between rows
+ROW_SEPARATOR_LIMIT = 10
+
+
+def _column_schema(*columns: tuple) -> tuple:
+    """Pre-parse column styles once; each column is (header, style, width, justify)."""
+    return tuple(
+        (header, Style.parse(style) if style else "", width, justify)
+        for header, style, width, justify in columns
+    )
+
+
+def _add_columns(
+    table: Table, schema: tuple, no_wrap: bool = False, wrap_headers: tuple = ()
+) -> Table:
+    """Add the columns from a schema to a table; wrap_headers are exempt from no_wrap."""
+    for header, style, width, justify in schema:
+        table.add_column(
+            header, style=style, width=width, justify=justify,
+            no_wrap=no_wrap and header not in wrap_headers
+        )
+    return table
+
+
+# Column schemas for the console tables
+POSITIONS_COLUMNS = _column_schema(
+    ("#", "dim white", 4, "center"),
+    ("Symbol", "bold bright_yellow", 8, "center"),
+    ("Side", "bold", 8, "center"),
+    ("Size", None, 12, "right"),
+    ("Entry", None, 12, "right"),
+    ("Mark", None, 12, "right"),
+    ("Liq", None, 12, "right"),
+    ("P&L", None, 12, "right"),
+    ("P&L %", None, 8, "right"),
+    ("Leverage", None, 8, "right"),
+    ("Margin", None, 12, "right"),
+)
+PRICES_COLUMNS = _column_schema(
+    ("💰 Symbol", "bold bright_yellow", 12, "center"),
+    ("💵 Price", "bold bright_green", 15, "right"),
+    ("⏰ Age", "dim bright_white", 10, "right"),
+)
+FILLS_COLUMNS = _column_schema(
+    ("#", "dim", 3, "left"),
+    ("Symbol", "bold", None, "left"),
+    ("Role", "bold", None, "left"),
+    ("Size", None, None, "right"),
+    ("Price", None, None, "right"),
+    ("P&L", None, None, "right"),
+    ("Fee", None, None, "right"),
+    ("Time", "dim", None, "left"),
+)
+ORDERS_COLUMNS = _column_schema(
+    ("#", "dim", 3, "left"),
+    ("Symbol", "bold", None, "left"),
+    ("Side", "bold", None, "left"),
+    ("Type", "bold", None, "left"),
+    ("Size", None, None, "right"),
+    ("Price", None, None, "right"),
+    ("Value", None, None, "right"),
+)
+
+# Colour bands as (thresholds, colours); a value above the n-th threshold gets colour n+1
+_RISK_COLORS = ("bright_green", "bright_yellow", "bright_red")
+CROSS_LEVERAGE_BANDS = ((10, 20), _RISK_COLORS)
+MARGIN_RATIO_BANDS = ((70, 90), _RISK_COLORS)
+POSITION_LEVERAGE_BANDS = ((15, 25), _RISK_COLORS)
+PRICE_AGE_BANDS = ((30, 60), _RISK_COLORS)
+PRICE_VALUE_BANDS = ((10, 100, 1000), ("bright_yellow", "bright_green", "bright_cyan", "bright_magenta"))
+
+# Liquidation distance is safer the larger it is: below 5% red, below 15% yellow
+LIQ_DISTANCE_THRESHOLDS = (5, 15)
+LIQ_DISTANCE_COLORS = ("bright_red", "bright_yellow", "bright_green")
+
+
+def _band_color(value: float, bands: tuple) -> str:
+    """Pick the colour for a value from a (thresholds, colours) band table."""
+    thresholds, colors = bands
+    return colors[bisect_left(thresholds, value)]
+
+
+@lru_cache(maxsize=32)
+def _error_panel(error_type: str, details: str) -> Panel:
+    """Build the error panel; the same error type and details reuse one panel."""
+    base_message = ERROR_MESSAGES.get(error_type, ERROR_MESSAGES['unknown_error'])
+    
+    # Build the final text in one go rather than appending piece by piece
+    if details:
+        message = f"{base_message}\n\nDetails: {details}\n\n{ERROR_FOOTER}"
+    else:
+        message = f"{base_message}\n\n{ERROR_FOOTER}"
+    
+    return Panel(message, title="❌ Error", style="red")
+
+
+@lru_cache(maxsize=4)
+def _startup_panel(wallet_address: str, refresh_interval: int) -> Panel:
+    """Build the startup panel for a wallet and refresh interval."""
+    startup_text = f"""🚀 Hyperliquid Bot Started
+
+✅ Successfully connected to Hyperliquid API
+🔗 Monitoring wallet: {wallet_address[:8]}...{wallet_address[-8:]}
+🔄 Refresh interval: {refresh_interval} seconds
+
+📊 The bot will monitor your positions and account status.
+"""
+    
+    return Panel(startup_text, title="🚀 Startup", style="green")
 
 
 class ConsoleFormatter:
     """Formats data for console output with rich formatting."""
     
     def __init__(self):
-        self.console = Console()
+        self.console = _CONSOLE
+        self._last_positions_digest: Optional[int] = None
+    
+    def positions_unchanged(
+        self, 
+        positions: List[Position], 
+        account_summary: AccountSummary
+    ) -> bool:
+        """Check whether positions match the last summary, remembering the new state."""
+        digest = hash((
+            account_summary.account_value,
+            account_summary.cross_leverage,
+            tuple(
+                (p.symbol, p.size, round(p.mark_price, 4), round(p.unrealized_pnl, 2))
+                for p in positions
+            )
+        ))
+        if digest == self._last_positions_digest:
+            return True
+        self._last_positions_digest = digest
+        return False
     
     def format_positions_summary(
         self, 
@@ -32,12 +194,23 @@ class ConsoleFormatter:
         
         if not positions:
             self.console.print(Panel(
-                "[red]❌ No active positions found.[/red]", 
-                title="[bold cyan]📊 Position Summary[/bold cyan]",
+                Text("❌ No active positions found.", style="red"), 
+                title="[bold cyan]📊 Position Summary[/]",
                 border_style="cyan"
             ))
             return
         
+        # Extract row values in a single pass, summing P&L along the way
+        rows = []
+        total_pnl = 0.0
+        for p in positions:
+            pnl = p.unrealized_pnl
+            total_pnl += pnl
+            rows.append((pnl, p.leverage, p.mark_price, p.liq_price, p.to_display_row()))
+        
+        # Sort rows by unrealized PnL (most profitable first)
+        rows.sort(key=itemgetter(0), reverse=True)
+        
         # Account summary table with enhanced styling
         account_table = Table(
             show_header=False, 
@@ -49,204 +222,189 @@ class ConsoleFormatter:
         account_table.add_column("Value", style="bold bright_white", width=25)
         
         # Account value with color coding
-        account_value_style = "bold bright_green" if account_summary.account_value > 0 else "bold bright_red"
+        account_value_color = "bright_green" if account_summary.account_value > 0 else "bright_red"
         account_table.add_row(
             "💰 Account Value", 
-            f"[{account_value_style}]${account_summary.account_value:,.2f}[/{account_value_style}]"
+            Text(f"${account_summary.account_value:,.2f}", style=BOLD_STYLES[account_value_color])
         )
         
         # Total P&L with dynamic coloring
-        total_pnl = sum(p.unrealized_pnl for p in positions)
         pnl_color = "bright_green" if total_pnl >= 0 else "bright_red"
         pnl_symbol = "📈" if total_pnl >= 0 else "📉"
         account_table.add_row(
             f"{pnl_symbol} Total P&L", 
-            f"[bold {pnl_color}]${total_pnl:+,.2f}[/bold {pnl_color}]"
+            Text(f"${total_pnl:+,.2f}", style=BOLD_STYLES[pnl_color])
         )
         
         # Leverage with warning colors
-        leverage_color = "bright_red" if account_summary.cross_leverage > 20 else "bright_yellow" if account_summary.cross_leverage > 10 else "bright_green"
+        leverage_color = _band_color(account_summary.cross_leverage, CROSS_LEVERAGE_BANDS)
         account_table.add_row(
             "🔄 Cross Leverage", 
-            f"[bold {leverage_color}]{account_summary.cross_leverage:.2f}x[/bold {leverage_color}]"
+            Text(f"{account_summary.cross_leverage:.2f}x", style=BOLD_STYLES[leverage_color])
         )
         
         # Margin usage with risk coloring
         margin_ratio = account_summary.cross_margin_ratio
-        margin_color = "bright_red" if margin_ratio > 90 else "bright_yellow" if margin_ratio > 70 else "bright_green"
+        margin_color = _band_color(margin_ratio, MARGIN_RATIO_BANDS)
         account_table.add_row(
             "💳 Margin Used", 
-            f"[bold {margin_color}]${account_summary.total_margin_used:,.2f} ({margin_ratio:.1f}%)[/bold {margin_color}]"
+            Text(
+                f"${account_summary.total_margin_used:,.2f} ({margin_ratio:.1f}%)",
+                style=BOLD_STYLES[margin_color]
+            )
         )
         
         # Available balance with color coding
         available_color = "bright_red" if account_summary.available_balance < 0 else "bright_green"
         account_table.add_row(
             "💵 Available", 
-            f"[bold {available_color}]${account_summary.available_balance:,.2f}[/bold {available_color}]"
+            Text(f"${account_summary.available_balance:,.2f}", style=BOLD_STYLES[available_color])
         )
         
         # Portfolio metrics if provided
         if portfolio_metrics:
             account_table.add_row("", "")  # Spacer
             account_table.add_row(
-                "[dim]📊 Total Positions[/dim]", 
-                f"[bold bright_white]{portfolio_metrics['total_positions']}[/bold bright_white]"
+                Text("📊 Total Positions", style=DIM_STYLE), 
+                Text(f"{portfolio_metrics['total_positions']}", style=BOLD_STYLES["bright_white"])
             )
             account_table.add_row(
-                "[dim]✅ Profitable[/dim]", 
-                f"[bold bright_green]{portfolio_metrics['profitable_positions']}[/bold bright_green]"
+                Text("✅ Profitable", style=DIM_STYLE), 
+                Text(f"{portfolio_metrics['profitable_positions']}", style=BOLD_STYLES["bright_green"])
             )
             account_table.add_row(
-                "[dim]❌ Losing[/dim]", 
-                f"[bold bright_red]{portfolio_metrics['losing_positions']}[/bold bright_red]"
+                Text("❌ Losing", style=DIM_STYLE), 
+                Text(f"{portfolio_metrics['losing_positions']}", style=BOLD_STYLES["bright_red"])
             )
             account_table.add_row(
-                "[dim]📏 Avg Leverage[/dim]", 
-                f"[bold bright_cyan]{portfolio_metrics['average_leverage']:.2f}x[/bold bright_cyan]"
+                Text("📏 Avg Leverage", style=DIM_STYLE), 
+                Text(f"{portfolio_metrics['average_leverage']:.2f}x", style=BOLD_STYLES["bright_cyan"])
             )
             account_table.add_row(
-                "[dim]🎯 Largest Position[/dim]", 
-                f"[bold bright_magenta]${portfolio_metrics['largest_position_value']:,.2f}[/bold bright_magenta]"
+                Text("🎯 Largest Position", style=DIM_STYLE), 
+                Text(f"${portfolio_metrics['largest_position_value']:,.2f}", style=BOLD_STYLES["bright_magenta"])
             )
         
         # Enhanced positions table with colorful styling
         positions_table = Table(
-            title="[bold bright_cyan]🎯 Active Positions[/bold bright_cyan]",
+            title="🎯 Active Positions",
+            title_style=TABLE_TITLE_STYLE,
             border_style="bright_cyan",
             header_style="bold bright_white on blue",
-            show_lines=True,
+            show_lines=len(rows) <= ROW_SEPARATOR_LIMIT,
             expand=True
         )
         
-        positions_table.add_column("#", style="dim white", width=4, justify="center")
-        positions_table.add_column("Symbol", style="bold bright_yellow", width=8, justify="center")
-        positions_table.add_column("Side", style="bold", width=6, justify="center")
-        positions_table.add_column("Size", justify="right", width=12)
-        positions_table.add_column("Entry", justify="right", width=12)
-        positions_table.add_column("Mark", justify="right", width=12)
-        positions_table.add_column("Liq", justify="right", width=12)
-        positions_table.add_column("P&L", justify="right", width=12)
-        positions_table.add_column("P&L %", justify="right", width=8)
-        positions_table.add_column("Leverage", justify="right", width=8)
-        positions_table.add_column("Margin", justify="right", width=12)
-        
-        # Sort positions by unrealized PnL (most profitable first)
-        sorted_positions = sorted(positions, key=lambda p: p.unrealized_pnl, reverse=True)
-        
-        for i, position in enumerate(sorted_positions, 1):
+        # Narrow terminals shrink every column; wrap the side label rather than crop it
+        _add_columns(positions_table, POSITIONS_COLUMNS, no_wrap=True, wrap_headers=("Side",))
+        
+        for i, (pnl, leverage, mark, liq, cells) in enumerate(rows, 1):
+            symbol, side, size, entry, mark_text, liq_text, pnl_text, pnl_pct, lev_text, margin = cells
+            
             # Dynamic styling based on position characteristics
-            side_color = "bright_green" if position.side.value == "LONG" else "bright_red"
-            side_icon = "📈" if position.side.value == "LONG" else "📉"
+            is_long = side == "LONG"
+            side_color = "bright_green" if is_long else "bright_red"
+            side_icon = "📈" if is_long else "📉"
             
-            pnl_color = "bright_green" if position.is_profitable else "bright_red"
-            pnl_bg = "on green" if position.is_profitable else "on red"
+            pnl_color = "bright_green" if pnl >= 0 else "bright_red"
             
             # Risk level coloring for leverage
-            lev_color = "bright_red" if position.leverage > 25 else "bright_yellow" if position.leverage > 15 else "bright_green"
+            lev_color = _band_color(leverage, POSITION_LEVERAGE_BANDS)
             
-            # Liquidation distance coloring
-            liq_distance = abs(position.mark_price - position.liq_price) / position.mark_price * 100
-            liq_color = "bright_red" if liq_distance < 5 else "bright_yellow" if liq_distance < 15 else "bright_green"
+            # Liquidation distance coloring (unpriced positions count as far from liquidation)
+            liq_distance = abs(mark - liq) * (100.0 / mark) if mark else float("inf")
+            liq_color = LIQ_DISTANCE_COLORS[bisect_right(LIQ_DISTANCE_THRESHOLDS, liq_distance)]
             
+            pnl_style = BOLD_STYLES[pnl_color]
             positions_table.add_row(
-                f"[dim]{i}[/dim]",
-                f"[bold bright_yellow]{position.symbol}[/bold bright_yellow]",
-                f"[bold {side_color}]{side_icon} {position.side.value[:4]}[/bold {side_color}]",
-                f"[bright_white]{position.size:,.4f}[/bright_white]",
-                f"[bright_cyan]${position.entry_price:,.4f}[/bright_cyan]",
-                f"[bright_magenta]${position.mark_price:,.4f}[/bright_magenta]",
-                f"[{liq_color}]${position.liq_price:,.4f}[/{liq_color}]",
-                f"[bold {pnl_color}]${position.unrealized_pnl:+,.2f}[/bold {pnl_color}]",
-                f"[bold {pnl_color}]{position.pnl_percentage:+.2f}%[/bold {pnl_color}]",
-                f"[bold {lev_color}]{position.leverage:.1f}x[/bold {lev_color}]",
-                f"[bright_white]${position.margin_used:,.2f}[/bright_white]"
+                Text(str(i), style=DIM_STYLE),
+                Text(symbol, style=BOLD_STYLES["bright_yellow"]),
+                Text(f"{side_icon} {side[:4]}", style=BOLD_STYLES[side_color]),
+                Text(size, style=STYLES["bright_white"]),
+                Text(entry, style=STYLES["bright_cyan"]),
+                Text(mark_text, style=STYLES["bright_magenta"]),
+                Text(liq_text, style=STYLES[liq_color]),
+                Text(pnl_text, style=pnl_style),
+                Text(pnl_pct, style=pnl_style),
+                Text(lev_text, style=BOLD_STYLES[lev_color]),
+                Text(margin, style=STYLES["bright_white"])
             )
         
-        # Display everything with enhanced panels
-        self.console.print(Panel(
-            account_table, 
-            title="[bold bright_cyan]📊 Account Summary[/bold bright_cyan]",
-            border_style="bright_cyan",
-            padding=(1, 2)
-        ))
-        self.console.print(positions_table)
+        # Display everything with enhanced panels in a single buffered write
+        self.console.print(
+            Panel(
+                account_table, 
+                title="[bold bright_cyan]📊 Account Summary[/]",
+                border_style="bright_cyan",
+                padding=(1, 2)
+            ),
+            positions_table
+        )
     
     def format_prices_table(self, price_collection: PriceCollection, symbols: List[str]) -> None:
         """Format and print price data to console."""
         
         if len(price_collection) == 0:
             self.console.print(Panel(
-                "[red]❌ No price data available.[/red]", 
-                title="[bold bright_cyan]📈 Token Prices[/bold bright_cyan]",
+                Text("❌ No price data available.", style="red"), 
+                title="[bold bright_cyan]📈 Token Prices[/]",
                 border_style="bright_cyan"
             ))
             return
         
         # Enhanced price table with colorful styling
         price_table = Table(
-            title="[bold bright_cyan]📈 Token Prices[/bold bright_cyan]",
+            title="📈 Token Prices",
+            title_style=TABLE_TITLE_STYLE,
             border_style="bright_cyan",
             header_style="bold bright_white on blue",
-            show_lines=True,
+            show_lines=len(symbols) <= ROW_SEPARATOR_LIMIT,
             expand=True
         )
-        price_table.add_column("💰 Symbol", style="bold bright_yellow", width=12, justify="center")
-        price_table.add_column("💵 Price", justify="right", style="bold bright_green", width=15)
-        price_table.add_column("⏰ Age", justify="right", style="dim bright_white", width=10)
-        
-        # Filter and sort requested symbols
-        found_symbols = []
-        missing_symbols = []
-        
-        for symbol in symbols:
-            price_data = price_collection.get_price(symbol)
-            if price_data:
-                found_symbols.append((symbol, price_data))
-            else:
-                missing_symbols.append(symbol)
-        
-        # Sort by symbol name
-        found_symbols.sort(key=lambda x: x[0])
+        _add_columns(price_table, PRICES_COLUMNS, no_wrap=True)
+        
+        # Split requested symbols into found and missing, sorted by symbol name
+        requested = set(symbols)
+        have = requested & price_collection.keys()
+        missing_symbols = sorted(requested - have)
+        found_symbols = sorted(
+            ((symbol, price_collection.get_price(symbol)) for symbol in have),
+            key=itemgetter(0)
+        )
         
         # Add found prices with enhanced styling
         for symbol, price_data in found_symbols:
             age_seconds = price_data.age_seconds
-            age_color = "bright_red" if age_seconds > 60 else "bright_yellow" if age_seconds > 30 else "bright_green"
-            age_text = f"[{age_color}]{age_seconds:.0f}s[/{age_color}]"
+            age_color = _band_color(age_seconds, PRICE_AGE_BANDS)
+            age_text = Text(f"{age_seconds:.0f}s", style=STYLES[age_color])
             
             # Price formatting with dynamic colors based on value
             price_value = price_data.price
-            if price_value > 1000:
-                price_color = "bright_magenta"
-            elif price_value > 100:
-                price_color = "bright_cyan"
-            elif price_value > 10:
-                price_color = "bright_green"
-            else:
-                price_color = "bright_yellow"
+            price_color = _band_color(price_value, PRICE_VALUE_BANDS)
             
             price_table.add_row(
-                f"[bold bright_yellow]{symbol}[/bold bright_yellow]",
-                f"[bold {price_color}]${price_value:,.4f}[/bold {price_color}]",
+                Text(symbol, style=BOLD_STYLES["bright_yellow"]),
+                Text(f"${price_value:,.4f}", style=BOLD_STYLES[price_color]),
                 age_text
             )
         
-        self.console.print(price_table)
+        renderables = [price_table]
         
         # Show missing symbols if any
         if missing_symbols:
-            self.console.print(Panel(
-                f"[red]❌ Not found: {', '.join(missing_symbols)}[/red]",
+            renderables.append(Panel(
+                Text(f"❌ Not found: {', '.join(missing_symbols)}", style="red"),
                 border_style="red"
             ))
         
         # Add timestamp with styling
-        timestamp_panel = Panel(
-            f"[dim bright_white]🕐 Updated: {datetime.now().strftime('%H:%M:%S')}[/dim bright_white]",
+        renderables.append(Panel(
+            Text(f"🕐 Updated: {hms_now()}", style="dim bright_white"),
             border_style="dim"
-        )
-        self.console.print(timestamp_panel)
+        ))
+        
+        # Print the whole view in one call so it reaches the terminal in one write
+        self.console.print(*renderables)
     
     def format_fills_table(self, fills: List[OrderFill]) -> None:
         """Format and print order fills to console."""
@@ -256,18 +414,12 @@ class ConsoleFormatter:
             return
         
         fills_table = Table(title=f"📑 Recent Fills (Last {len(fills)})")
-        fills_table.add_column("#", style="dim", width=3)
-        fills_table.add_column("Symbol", style="bold")
-        fills_table.add_column("Role", style="bold")
-        fills_table.add_column("Size", justify="right")
-        fills_table.add_column("Price", justify="right")
-        fills_table.add_column("P&L", justify="right")
-        fills_table.add_column("Fee", justify="right")
-        fills_table.add_column("Time", style="dim")
+        _add_columns(fills_table, FILLS_COLUMNS)
         
         for i, fill in enumerate(fills, 1):
-            pnl_style = "green" if fill.is_profitable else "red" if fill.closed_pnl < 0 else "white"
-            role_style = "yellow" if fill.role.value == "TAKER" else "blue"
+            # Colour realised winners and losers; break-even fills stay unstyled
+            pnl = fill.closed_pnl
+            row_style = "green" if pnl > 0 else "red" if pnl < 0 else None
             
             fills_table.add_row(
                 str(i),
@@ -275,10 +427,10 @@ class ConsoleFormatter:
                 fill.role.value,
                 f"{fill.size:,.4f}",
                 f"${fill.price:,.4f}",
-                f"${fill.closed_pnl:+,.2f}",
+                f"${pnl:+,.2f}",
                 f"${fill.fee:,.4f}",
                 fill.formatted_timestamp,
-                style=pnl_style if abs(fill.closed_pnl) > 0 else None
+                style=row_style
             )
         
         self.console.print(fills_table)
@@ -291,17 +443,10 @@ class ConsoleFormatter:
             return
         
         orders_table = Table(title=f"🧾 Open Orders ({len(orders)})")
-        orders_table.add_column("#", style="dim", width=3)
-        orders_table.add_column("Symbol", style="bold")
-        orders_table.add_column("Side", style="bold")
-        orders_table.add_column("Type", style="bold")
-        orders_table.add_column("Size", justify="right")
-        orders_table.add_column("Price", justify="right")
-        orders_table.add_column("Value", justify="right")
+        _add_columns(orders_table, ORDERS_COLUMNS)
         
         for i, order in enumerate(orders, 1):
             side_style = "green" if order.side.value == "BUY" else "red"
-            type_style = "blue" if order.order_type.value == "LIMIT" else "yellow"
             
             orders_table.add_row(
                 str(i),
@@ -318,38 +463,11 @@ class ConsoleFormatter:
     
     def format_error_message(self, error_type: str, details: str = "") -> None:
         """Format and print error message to console."""
-        
-        error_messages = {
-            'api_error': '🚫 API Error: Failed to fetch data from Hyperliquid API.',
-            'network_error': '🌐 Network Error: Connection issue detected.',
-            'data_error': '📊 Data Error: Invalid or missing data received.',
-            'auth_error': '🔐 Authentication Error: Invalid credentials or permissions.',
-            'rate_limit': '⏱️ Rate Limited: Too many requests. Please wait.',
-            'unknown_error': '❓ Unknown Error: An unexpected error occurred.'
-        }
-        
-        base_message = error_messages.get(error_type, error_messages['unknown_error'])
-        
-        if details:
-            base_message += f"\n\nDetails: {details}"
-        
-        base_message += "\n\n💡 Try again in a few moments or contact support if the issue persists."
-        
-        self.console.print(Panel(base_message, title="❌ Error", style="red"))
+        self.console.print(_error_panel(error_type, details))
     
     def format_startup_message(self, wallet_address: str, refresh_interval: int) -> None:
         """Format and print startup message to console."""
-        
-        startup_text = f"""🚀 Hyperliquid Bot Started
-
-✅ Successfully connected to Hyperliquid API
-🔗 Monitoring wallet: {wallet_address[:8]}...{wallet_address[-8:]}
-🔄 Refresh interval: {refresh_interval} seconds
-
-📊 The bot will monitor your positions and account status.
-"""
-        
-        self.console.print(Panel(startup_text, title="🚀 Startup", style="green"))
+        self.console.print(_startup_panel(wallet_address, refresh_interval))
     
     def format_status_message(
         self, 
@@ -382,26 +500,130 @@ class ConsoleFormatter:
         status_table.add_row("⏰ Oldest Cache", f"{cache_stats.get('oldest_age', 0):.1f}s")
         
         status_table.add_row("", "")  # Spacer
-        status_table.add_row("🔄 Last Updated", datetime.now().strftime('%H:%M:%S'))
+        status_table.add_row("🔄 Last Updated", hms_now())
         
         self.console.print(Panel(status_table, title="🔧 System Status"))
     
+    # One-line helpers use console.out, which skips print's layout and wrapping
+    # but still honours the console buffer and drops styling off a terminal
     def print_separator(self) -> None:
         """Print a separator line."""
-        self.console.print("─" * 80, style="dim")
+        self.console.out(SEPARATOR, style="dim")
     
     def print_info(self, message: str) -> None:
         """Print info message."""
-        self.console.print(f"ℹ️ {message}", style="blue")
+        self.console.out(f"ℹ️ {message}", style="blue")
     
     def print_success(self, message: str) -> None:
         """Print success message."""
-        self.console.print(f"✅ {message}", style="green")
+        self.console.out(f"✅ {message}", style="green")
     
     def print_warning(self, message: str) -> None:
         """Print warning message."""
-        self.console.print(f"⚠️ {message}", style="yellow")
+        self.console.out(f"⚠️ {message}", style="yellow")
     
     def print_error(self, message: str) -> None:
         """Print error message."""
-        self.console.print(f"❌ {message}", style="red")
+        self.console.out(f"❌ {message}", style="red")
+
+
+class PlainConsoleFormatter(ConsoleFormatter):
+    """Writes tab-separated plain text instead of Rich tables for non-interactive output."""
+    
+    def format_positions_summary(
+        self, 
+        positions: List[Position], 
+        account_summary: AccountSummary,
+        portfolio_metrics: Optional[dict] = None
+    ) -> None:
+        """Format and print positions summary as plain text."""
+        
+        if not positions:
+            self.console.out("Position Summary: no active positions found.")
+            return
+        
+        sorted_positions = sorted(positions, key=_pnl_key, reverse=True)
+        total_pnl = sum(map(_pnl_key, positions))
+        
+        lines = [
+            f"Account Value: ${account_summary.account_value:,.2f} | "
+            f"Total P&L: ${total_pnl:+,.2f} | "
+            f"Cross Leverage: {account_summary.cross_leverage:.2f}x | "
+            f"Margin Used: ${account_summary.total_margin_used:,.2f} "
+            f"({account_summary.cross_margin_ratio:.1f}%) | "
+            f"Available: ${account_summary.available_balance:,.2f}"
+        ]
+        if portfolio_metrics:
+            lines.append(
+                f"Positions: {portfolio_metrics['total_positions']} "
+                f"({portfolio_metrics['profitable_positions']} profitable / "
+                f"{portfolio_metrics['losing_positions']} losing) | "
+                f"Avg Leverage: {portfolio_metrics['average_leverage']:.2f}x | "
+                f"Largest Position: ${portfolio_metrics['largest_position_value']:,.2f}"
+            )
+        
+        lines.append("\t".join(header for header, *_ in POSITIONS_COLUMNS))
+        for i, row in enumerate(map(Position.to_display_row, sorted_positions), 1):
+            lines.append(f"{i}\t" + "\t".join(row))
+        
+        self.console.out("\n".join(lines))
+    
+    def format_prices_table(self, price_collection: PriceCollection, symbols: List[str]) -> None:
+        """Format and print price data as plain text."""
+        
+        if len(price_collection) == 0:
+            self.console.out("Token Prices: no price data available.")
+            return
+        
+        requested = set(symbols)
+        have = requested & price_collection.keys()
+        missing_symbols = sorted(requested - have)
+        
+        lines = ["Token Prices"]
+        for symbol in sorted(have):
+            price_data = price_collection.get_price(symbol)
+            lines.append(f"{symbol}\t${price_data.price:,.4f}\t{price_data.age_seconds:.0f}s")
+        if missing_symbols:
+            lines.append(f"Not found: {', '.join(missing_symbols)}")
+        lines.append(f"Updated: {hms_now()}")
+        
+        self.console.out("\n".join(lines))
+    
+    def format_fills_table(self, fills: List[OrderFill]) -> None:
+        """Format and print order fills as plain text."""
+        
+        if not fills:
+            self.console.out("Recent Fills: no recent fills found.")
+            return
+        
+        lines = [f"Recent Fills (Last {len(fills)})"]
+        lines.append("\t".join(header for header, *_ in FILLS_COLUMNS))
+        for i, fill in enumerate(fills, 1):
+            lines.append(
+                f"{i}\t{fill.symbol}\t{fill.role.value}\t{fill.size:,.4f}\t${fill.price:,.4f}\t"
+                f"${fill.closed_pnl:+,.2f}\t${fill.fee:,.4f}\t{fill.formatted_timestamp}"
+            )
+        
+        self.console.out("\n".join(lines))
+    
+    def format_orders_table(self, orders: List[Order]) -> None:
+        """Format and print open orders as plain text."""
+        
+        if not orders:
+            self.console.out("Open Orders: no open orders found.")
+            return
+        
+        lines = [f"Open Orders ({len(orders)})"]
+        lines.append("\t".join(header for header, *_ in ORDERS_COLUMNS))
+        for i, order in enumerate(orders, 1):
+            lines.append(
+                f"{i}\t{order.symbol}\t{order.side.value}\t{order.order_type.value}\t"
+                f"{order.size:,.4f}\t${order.price:,.4f}\t${order.order_value:,.2f}"
+            )
+        
+        self.console.out("\n".join(lines))
+
+
+def get_console_formatter() -> ConsoleFormatter:
+    """Get the Rich formatter for a terminal, or the plain one when output is redirected."""
+    return ConsoleFormatter() if _CONSOLE.is_terminal else PlainConsoleFormatter()
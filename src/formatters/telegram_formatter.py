@@ -3,12 +3,30 @@ Telegram message formatter for position and trading data.
 """
 
 from typing import List, Optional
-from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 
 from ..models.position import Position
 from ..models.account import AccountSummary
 from ..models.order import Order, OrderFill
 from ..models.price import PriceCollection
+from .timestamps import hms_now
+
+_pnl_key = attrgetter("unrealized_pnl")
+
+ERROR_MESSAGES = {
+    'api_error': '🚫 *API Error*\n\nFailed to fetch data from Hyperliquid API.',
+    'network_error': '🌐 *Network Error*\n\nConnection issue detected.',
+    'data_error': '📊 *Data Error*\n\nInvalid or missing data received.',
+    'auth_error': '🔐 *Authentication Error*\n\nInvalid credentials or permissions.',
+    'rate_limit': '⏱️ *Rate Limited*\n\nToo many requests. Please wait.',
+    'timeout': '⌛ *Timed Out*\n\nThe request took too long to complete.',
+    'unknown_error': '❓ *Unknown Error*\n\nAn unexpected error occurred.'
+}
+ERROR_FOOTER = "💡 Try again in a few moments or contact support if the issue persists."
+
+# Characters Telegram treats as Markdown, mapped to their escaped form
+_MARKDOWN_ESCAPES = str.maketrans({char: f"\\{char}" for char in "_*[]()~`>#+-=|{}.!"})
 
 
 class TelegramFormatter:
@@ -25,46 +43,53 @@ class TelegramFormatter:
         if not positions:
             return "📊 *Position Summary*\n\n❌ No active positions found."
         
+        # Collect message parts and join once at the end
+        parts = []
+        ap = parts.append
+        
         # Header with account summary
-        message = f"""📊 *Position Summary*
+        ap(f"""📊 *Position Summary*
 
 💰 *Account Value*: ${account_summary.account_value:,.2f}
-📈 *Total P&L*: ${sum(p.unrealized_pnl for p in positions):+,.2f}
+📈 *Total P&L*: ${sum(map(_pnl_key, positions)):+,.2f}
 🔄 *Cross Leverage*: {account_summary.cross_leverage:.2f}x
 💳 *Margin Used*: ${account_summary.total_margin_used:,.2f} ({account_summary.cross_margin_ratio:.1f}%)
 💵 *Available*: ${account_summary.available_balance:,.2f}
 
-"""
+""")
         
         # Add portfolio metrics if provided
         if portfolio_metrics:
-            message += f"""📈 *Portfolio Metrics*:
+            ap(f"""📈 *Portfolio Metrics*:
 • Positions: {portfolio_metrics['total_positions']} ({portfolio_metrics['profitable_positions']}✅ / {portfolio_metrics['losing_positions']}❌)
 • Avg Leverage: {portfolio_metrics['average_leverage']:.2f}x
 • Largest Position: ${portfolio_metrics['largest_position_value']:,.2f}
 
-"""
+""")
         
-        message += "🎯 *Active Positions*:\n\n"
+        ap("🎯 *Active Positions*:\n\n")
         
         # Sort positions by unrealized PnL (most profitable first)
-        sorted_positions = sorted(positions, key=lambda p: p.unrealized_pnl, reverse=True)
+        sorted_positions = sorted(positions, key=_pnl_key, reverse=True)
         
         for i, position in enumerate(sorted_positions, 1):
-            pnl_emoji = "🟢" if position.is_profitable else "🔴"
-            side_emoji = "📈" if position.side.value == "LONG" else "📉"
+            # Resolve enum value and derived properties once per row
+            side = position.side.value
+            pnl = position.unrealized_pnl
+            pnl_emoji = "🟢" if pnl >= 0 else "🔴"
+            side_emoji = "📈" if side == "LONG" else "📉"
             
-            message += f"""{i}. {side_emoji} *{position.symbol}* {position.side.value}
+            ap(f"""{i}. {side_emoji} *{position.symbol}* {side}
     📏 Size: {position.size:,.4f} @ ${position.entry_price:,.4f}
     📊 Mark: ${position.mark_price:,.4f}
     ⚠️ Liq: ${position.liq_price:,.4f}
-    {pnl_emoji} P&L: ${position.unrealized_pnl:+,.2f} ({position.pnl_percentage:+.2f}%)
+    {pnl_emoji} P&L: ${pnl:+,.2f} ({position.pnl_percentage:+.2f}%)
     ⚡ Leverage: {position.leverage:.1f}x
     💳 Margin: ${position.margin_used:,.2f}
 
-"""
+""")
         
-        return message.strip()
+        return "".join(parts).strip()
     
     @staticmethod
     def format_prices_message(price_collection: PriceCollection, symbols: List[str]) -> str:
@@ -73,34 +98,26 @@ class TelegramFormatter:
         if len(price_collection) == 0:
             return "📈 *Token Prices*\n\n❌ No price data available."
         
-        message = "📈 *Token Prices*\n\n"
-        
-        # Filter and format requested symbols
-        found_symbols = []
-        missing_symbols = []
-        
-        for symbol in symbols:
-            price_data = price_collection.get_price(symbol)
-            if price_data:
-                found_symbols.append((symbol, price_data.price))
-            else:
-                missing_symbols.append(symbol)
+        # Split requested symbols into found and missing, sorted by symbol name
+        requested = set(symbols)
+        have = requested & price_collection.keys()
+        missing_symbols = sorted(requested - have)
+        found_symbols = sorted(
+            (symbol, price_collection.get_price(symbol).price) for symbol in have
+        )
         
-        # Sort by symbol name
-        found_symbols.sort(key=lambda x: x[0])
-        
-        # Add found prices
-        for symbol, price in found_symbols:
-            message += f"• *{symbol}*: ${price:,.4f}\n"
+        # Header and found prices, one line per symbol
+        parts = ["📈 *Token Prices*\n\n"]
+        parts.extend(f"• *{symbol}*: ${price:,.4f}\n" for symbol, price in found_symbols)
         
         # Add missing symbols note
         if missing_symbols:
-            message += f"\n❌ *Not found*: {', '.join(missing_symbols)}"
+            parts.append(f"\n❌ *Not found*: {', '.join(missing_symbols)}")
         
         # Add timestamp
-        message += f"\n\n🕐 *Updated*: {datetime.now().strftime('%H:%M:%S')}"
+        parts.append(f"\n\n🕐 *Updated*: {hms_now()}")
         
-        return message
+        return "".join(parts)
     
     @staticmethod
     def format_fills_message(fills: List[OrderFill]) -> str:
@@ -109,20 +126,25 @@ class TelegramFormatter:
         if not fills:
             return "📑 *Recent Fills*\n\n❌ No recent fills found."
         
-        message = f"📑 *Recent Fills* (Last {len(fills)})\n\n"
+        # Collect message parts and join once at the end
+        parts = [f"📑 *Recent Fills* (Last {len(fills)})\n\n"]
+        ap = parts.append
         
         for i, fill in enumerate(fills, 1):
-            pnl_emoji = "🟢" if fill.is_profitable else "🔴" if fill.closed_pnl < 0 else "⚪"
-            role_emoji = "⚡" if fill.role.value == "TAKER" else "🎯"
+            # Resolve enum value and P&L once per row
+            role = fill.role.value
+            closed_pnl = fill.closed_pnl
+            pnl_emoji = "🟢" if closed_pnl > 0 else "🔴" if closed_pnl < 0 else "⚪"
+            role_emoji = "⚡" if role == "TAKER" else "🎯"
             
-            message += f"""{i}. {role_emoji} *{fill.symbol}* ({fill.role.value})
+            ap(f"""{i}. {role_emoji} *{fill.symbol}* ({role})
    Size: {fill.size:,.4f} @ ${fill.price:,.4f}
-   {pnl_emoji} P&L: ${fill.closed_pnl:+,.2f} | Fee: ${fill.fee:,.4f}
+   {pnl_emoji} P&L: ${closed_pnl:+,.2f} | Fee: ${fill.fee:,.4f}
    Time: {fill.formatted_timestamp}
 
-"""
+""")
         
-        return message.strip()
+        return "".join(parts).strip()
     
     @staticmethod
     def format_orders_message(orders: List[Order]) -> str:
@@ -131,44 +153,40 @@ class TelegramFormatter:
         if not orders:
             return "🧾 *Open Orders*\n\n❌ No open orders found."
         
-        message = f"🧾 *Open Orders* ({len(orders)})\n\n"
+        # Collect message parts and join once at the end
+        parts = [f"🧾 *Open Orders* ({len(orders)})\n\n"]
+        ap = parts.append
         
         for i, order in enumerate(orders, 1):
-            side_emoji = "🟢" if order.side.value == "BUY" else "🔴"
-            type_emoji = "📌" if order.order_type.value == "LIMIT" else "⚡"
+            # Resolve enum values once per row
+            side = order.side.value
+            order_type = order.order_type.value
+            side_emoji = "🟢" if side == "BUY" else "🔴"
+            type_emoji = "📌" if order_type == "LIMIT" else "⚡"
             
-            message += f"""{i}. {side_emoji} {type_emoji} *{order.symbol}* {order.side.value}
+            ap(f"""{i}. {side_emoji} {type_emoji} *{order.symbol}* {side}
    Size: {order.size:,.4f} @ ${order.price:,.4f}
-   Type: {order.order_type.value}
+   Type: {order_type}
    Value: ${order.order_value:,.2f}
 
-"""
+""")
         
-        return message.strip()
+        return "".join(parts).strip()
     
     @staticmethod
+    @lru_cache(maxsize=32)
     def format_error_message(error_type: str, details: str = "") -> str:
         """Format error message for Telegram."""
         
-        error_messages = {
-            'api_error': '🚫 *API Error*\n\nFailed to fetch data from Hyperliquid API.',
-            'network_error': '🌐 *Network Error*\n\nConnection issue detected.',
-            'data_error': '📊 *Data Error*\n\nInvalid or missing data received.',
-            'auth_error': '🔐 *Authentication Error*\n\nInvalid credentials or permissions.',
-            'rate_limit': '⏱️ *Rate Limited*\n\nToo many requests. Please wait.',
-            'unknown_error': '❓ *Unknown Error*\n\nAn unexpected error occurred.'
-        }
-        
-        base_message = error_messages.get(error_type, error_messages['unknown_error'])
+        base_message = ERROR_MESSAGES.get(error_type, ERROR_MESSAGES['unknown_error'])
         
+        # Build the final text in one go rather than appending piece by piece
         if details:
-            base_message += f"\n\n*Details*: {details}"
-        
-        base_message += "\n\n💡 Try again in a few moments or contact support if the issue persists."
-        
-        return base_message
+            return f"{base_message}\n\n*Details*: {details}\n\n{ERROR_FOOTER}"
+        return f"{base_message}\n\n{ERROR_FOOTER}"
     
     @staticmethod
+    @lru_cache(maxsize=4)
     def format_startup_message(wallet_address: str, refresh_interval: int) -> str:
         """Format startup message for Telegram."""
         
@@ -209,18 +227,13 @@ Use /help to see available commands or interact with the menu below.
 • Avg Age: {cache_stats.get('average_age', 0):.1f}s
 • Oldest: {cache_stats.get('oldest_age', 0):.1f}s
 
-🔄 *Last Updated*: {datetime.now().strftime('%H:%M:%S')}
+🔄 *Last Updated*: {hms_now()}
 """
     
     @staticmethod
     def escape_markdown(text: str) -> str:
         """Escape special Markdown characters."""
-        special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-        
-        for char in special_chars:
-            text = text.replace(char, f'\\{char}')
-        
-        return text
+        return text.translate(_MARKDOWN_ESCAPES)
     
     @staticmethod
     def format_command_response(command: str, success: bool, message: str = "") -> str:
@@ -0,0 +1,16 @@
+"""
+Clock helpers shared by the formatters.
+"""
+
+import time
+
+# Last whole second seen and its formatted string
+_last_hms = [0, ""]
+
+
+def hms_now() -> str:
+    """Get the local time as HH:MM:SS, formatting at most once per second."""
+    now = int(time.time())
+    if now != _last_hms[0]:
+        _last_hms[:] = [now, time.strftime('%H:%M:%S', time.localtime(now))]
+    return _last_hms[1]
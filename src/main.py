@@ -11,16 +11,24 @@ from typing import Optional
 
 from .config.settings import Settings
 from .config.environment import EnvironmentConfig
-from .config.logging_config import setup_logging
+from .config.logging_config import setup_logging, shutdown_logging
 from .services.hyperliquid_api import HyperliquidAPIService
 from .services.telegram_service import TelegramService
 from .services.cache_service import PositionCacheService
 from .services.position_service import PositionService
 from .formatters.telegram_formatter import TelegramFormatter
-from .formatters.console_formatter import ConsoleFormatter
+from .formatters.console_formatter import ConsoleFormatter, get_console_formatter
 from .bot.telegram_bot import TelegramBot
+from .bot.webhook_bot import WebhookBot
 from .monitor.position_monitor import PositionMonitor
 
+# Longest time shutdown waits for cancelled background tasks to finish (seconds)
+SHUTDOWN_TIMEOUT = 5.0
+
+
+class InitializationError(RuntimeError):
+    """Raised by HyperliquidApp.run when the application fails to initialize."""
+
 
 class HyperliquidApp:
     """Main application class for Hyperliquid position monitoring."""
@@ -33,12 +41,12 @@ class HyperliquidApp:
         self.position_service: Optional[PositionService] = None
         self.telegram_bot: Optional[TelegramBot] = None
         self.position_monitor: Optional[PositionMonitor] = None
-        self.console_formatter = ConsoleFormatter()
+        self.console_formatter: ConsoleFormatter = get_console_formatter()
         self.logger: Optional[logging.Logger] = None
         self.start_time = time.time()
         self.shutdown_event = asyncio.Event()
     
-    def initialize(self) -> bool:
+    async def initialize(self) -> bool:
         """Initialize the application components."""
         try:
             # Validate environment
@@ -47,7 +55,8 @@ class HyperliquidApp:
                 return False
             
             # Load settings from environment
-            self.settings = Settings.from_env()
+            self.settings = Settings.from_env(env_config)
+            self.settings.validate()
             
             # Setup logging
             setup_logging(self.settings.log_level, self.settings.log_directory)
@@ -62,11 +71,12 @@ class HyperliquidApp:
             self.position_service = PositionService(self.api_service, self.cache_service)
             
             # Test connectivity
-            if not self._test_connectivity():
+            if not await self._test_connectivity():
                 return False
             
-            # Initialize bot components
-            self.telegram_bot = TelegramBot(
+            # Initialize bot components (webhook delivery when a public URL is configured)
+            bot_class = WebhookBot if self.settings.telegram_webhook_url else TelegramBot
+            self.telegram_bot = bot_class(
                 telegram_service=self.telegram_service,
                 position_service=self.position_service,
                 settings=self.settings
@@ -89,17 +99,21 @@ class HyperliquidApp:
                 print(f"❌ Failed to initialize application: {e}")
             return False
     
-    def _test_connectivity(self) -> bool:
+    async def _test_connectivity(self) -> bool:
         """Test connectivity to external services."""
         self.logger.info("🔍 Testing connectivity to external services...")
         
-        # Test Hyperliquid API
-        if not self.api_service.test_connectivity():
+        # The two checks are independent, so run them concurrently
+        api_ok, telegram_ok = await asyncio.gather(
+            self.api_service.test_connectivity_async(),
+            self.telegram_service.test_connectivity_async()
+        )
+        
+        if not api_ok:
             self.logger.error("❌ Failed to connect to Hyperliquid API")
             return False
         
-        # Test Telegram API
-        if not self.telegram_service.test_connectivity():
+        if not telegram_ok:
             self.logger.error("❌ Failed to connect to Telegram API")
             return False
         
@@ -108,27 +122,27 @@ class HyperliquidApp:
     
     async def run(self) -> None:
         """Run the main application loop."""
-        if not self.initialize():
-            sys.exit(1)
+        if not await self.initialize():
+            raise InitializationError("Application failed to initialize")
         
         # Setup signal handlers
         self._setup_signal_handlers()
         
-        # Send startup message
-        await self._send_startup_message()
-        
-        # Start background tasks
-        tasks = []
+        # Send startup message in the background so the bot and monitor start
+        # during the Telegram round trips (the first monitor cycle never alerts)
+        tasks = [asyncio.create_task(self._send_startup_message(), name="startup_message")]
         
         # Start Telegram bot
         if self.telegram_bot:
-            bot_task = asyncio.create_task(self.telegram_bot.start())
+            bot_task = asyncio.create_task(self.telegram_bot.start(), name="telegram_bot")
+            bot_task.add_done_callback(self._on_service_task_done)
             tasks.append(bot_task)
             self.logger.info("🤖 Telegram bot started")
         
         # Start position monitor
         if self.position_monitor:
-            monitor_task = asyncio.create_task(self.position_monitor.start())
+            monitor_task = asyncio.create_task(self.position_monitor.start(), name="position_monitor")
+            monitor_task.add_done_callback(self._on_service_task_done)
             tasks.append(monitor_task)
             self.logger.info("📊 Position monitor started")
         
@@ -150,10 +164,10 @@ class HyperliquidApp:
                 self.settings.refresh_interval
             )
             
-            success = self.telegram_service.send_message(startup_message)
+            success = await self.telegram_service.send_message_async(startup_message)
             if success:
                 # Also send command menu
-                self.telegram_service.send_command_menu()
+                await self.telegram_service.send_command_menu_async()
                 self.logger.info("📱 Startup message sent to Telegram")
             else:
                 self.logger.warning("⚠️ Failed to send startup message to Telegram")
@@ -161,17 +175,29 @@ class HyperliquidApp:
         except Exception as e:
             self.logger.error(f"❌ Error sending startup message: {e}")
     
+    def _on_service_task_done(self, task: asyncio.Task) -> None:
+        """Shut down when the bot or monitor stops with an error (logged by _shutdown)."""
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"❌ {task.get_name()} stopped unexpectedly, shutting down...")
+            self.shutdown_event.set()
+    
     def _setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
-            self.logger.info(f"🛑 Received signal {signum}, initiating shutdown...")
-            asyncio.create_task(self._trigger_shutdown())
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                # Runs the handler inside the event loop, woken through its selector
+                loop.add_signal_handler(sig, self._handle_signal, sig)
+            except NotImplementedError:
+                # Event loops without Unix signal support (e.g. Windows)
+                signal.signal(
+                    sig,
+                    lambda signum, frame: loop.call_soon_threadsafe(self._handle_signal, signum)
+                )
     
-    async def _trigger_shutdown(self) -> None:
-        """Trigger application shutdown."""
+    def _handle_signal(self, signum: int) -> None:
+        """Start graceful shutdown after SIGINT/SIGTERM."""
+        self.logger.info(f"🛑 Received signal {signum}, initiating shutdown...")
         self.shutdown_event.set()
     
     async def _shutdown(self, tasks: list) -> None:
@@ -183,15 +209,23 @@ class HyperliquidApp:
             if not task.done():
                 task.cancel()
         
-        # Wait for tasks to complete
+        # Wait for tasks to complete, but don't let a stuck task hold up shutdown
         if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+            done, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT)
+            for task in done:
+                if not task.cancelled() and task.exception():
+                    self.logger.error(f"❌ Task {task.get_name()} failed: {task.exception()}")
+            for task in pending:
+                self.logger.warning(
+                    f"⚠️ Task {task.get_name()} did not stop within {SHUTDOWN_TIMEOUT:g}s"
+                )
         
         # Close services
         if self.api_service:
             self.api_service.close()
         
         if self.telegram_service:
+            await self.telegram_service.aclose()
             self.telegram_service.close()
         
         # Clear cache
@@ -201,6 +235,7 @@ class HyperliquidApp:
         
         uptime = time.time() - self.start_time
         self.logger.info(f"✅ Application shutdown complete (uptime: {uptime:.1f}s)")
+        shutdown_logging()
     
     def get_uptime(self) -> float:
         """Get application uptime in seconds."""
@@ -210,7 +245,14 @@ class HyperliquidApp:
 async def main():
     """Main entry point."""
     app = HyperliquidApp()
-    await app.run()
+    try:
+        await app.run()
+    except InitializationError:
+        # Close whatever initialize() opened before giving up; nothing is
+        # opened before logging is set up
+        if app.logger:
+            await app._shutdown([])
+        sys.exit(1)
 
 
 if __name__ == "__main__":
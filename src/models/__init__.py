@@ -2,9 +2,38 @@
 Data models for Hyperliquid position monitoring.
 """
 
-from .position import Position
-from .account import AccountSummary
-from .order import Order, OrderFill
-from .price import PriceData
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .position import Position
+    from .account import AccountSummary
+    from .order import Order, OrderFill
+    from .price import PriceData
+
+# Exported name -> submodule; loaded on first attribute access (PEP 562)
+_LAZY_EXPORTS = {
+    'Position': 'position',
+    'AccountSummary': 'account',
+    'Order': 'order',
+    'OrderFill': 'order',
+    'PriceData': 'price',
+}
 
 __all__ = ['Position', 'AccountSummary', 'Order', 'OrderFill', 'PriceData']
+
+
+def __getattr__(name: str):
+    """Import a model's submodule the first time the model is accessed."""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily exported models alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
@@ -2,11 +2,11 @@
 Account data model.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountSummary:
     """Represents account summary information."""
     
@@ -15,6 +15,24 @@ class AccountSummary:
     total_raw_usd: float
     total_margin_used: float
     
+    # Derived metrics, computed once in __post_init__ and shared by every view
+    cross_margin_ratio: float = field(init=False)
+    cross_leverage: float = field(init=False)
+    available_balance: float = field(init=False)
+    equity_utilization: float = field(init=False)
+    
+    def __post_init__(self):
+        """Derive margin ratio, leverage and available balance."""
+        account_value = self.account_value
+        if account_value > 0:
+            self.cross_margin_ratio = (self.total_margin_used / account_value) * 100
+            self.cross_leverage = self.total_ntl_pos / account_value
+        else:
+            self.cross_margin_ratio = 0.0
+            self.cross_leverage = 0.0
+        self.available_balance = account_value - self.total_margin_used
+        self.equity_utilization = self.cross_margin_ratio
+    
     @classmethod
     def from_api_data(cls, data: dict) -> 'AccountSummary':
         """Create AccountSummary from Hyperliquid API data."""
@@ -25,32 +43,6 @@ class AccountSummary:
             total_margin_used=float(data.get('totalMarginUsed', 0))
         )
     
-    @property
-    def cross_margin_ratio(self) -> float:
-        """Calculate cross margin ratio as percentage."""
-        if self.account_value > 0:
-            return (self.total_margin_used / self.account_value) * 100
-        return 0.0
-    
-    @property
-    def cross_leverage(self) -> float:
-        """Calculate cross leverage."""
-        if self.account_value > 0:
-            return self.total_ntl_pos / self.account_value
-        return 0.0
-    
-    @property
-    def available_balance(self) -> float:
-        """Calculate available balance."""
-        return self.account_value - self.total_margin_used
-    
-    @property
-    def equity_utilization(self) -> float:
-        """Calculate equity utilization percentage."""
-        if self.account_value > 0:
-            return (self.total_margin_used / self.account_value) * 100
-        return 0.0
-    
     def to_dict(self) -> dict:
         """Convert account summary to dictionary."""
         return {
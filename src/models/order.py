@@ -2,7 +2,7 @@
 Order and order fill data models.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
 from enum import Enum
@@ -27,7 +27,13 @@ class FillRole(Enum):
     MAKER = "MAKER"
 
 
-@dataclass
+# API codes resolved with a dict lookup instead of Enum construction
+_ORDER_TYPES = {order_type.value: order_type for order_type in OrderType}
+_ORDER_SIDES = {'A': OrderSide.SELL, 'B': OrderSide.BUY}  # Hyperliquid SDK: 'A' = sell, 'B' = buy
+_FILL_ROLES = {'A': FillRole.TAKER, 'B': FillRole.MAKER}  # 'A' = aggressor, 'B' = passive
+
+
+@dataclass(slots=True)
 class Order:
     """Represents an open order."""
     
@@ -46,23 +52,11 @@ class Order:
         price = float(data.get('limitPx', data.get('px', data.get('price', 0))))
         order_type_str = data.get('orderType', data.get('type', 'LIMIT')).upper()
         
-        # Map order type
-        try:
-            order_type = OrderType(order_type_str)
-        except ValueError:
-            order_type = OrderType.LIMIT
-        
-        # Get side field - according to Hyperliquid SDK: 'A' = sell, 'B' = buy
-        side_code = data.get('side', '')
+        # Map order type (unknown types are treated as limit orders)
+        order_type = _ORDER_TYPES.get(order_type_str, OrderType.LIMIT)
         
-        # Determine side based on side field
-        if side_code == 'A':  # 'A' = SELL
-            side = OrderSide.SELL
-        elif side_code == 'B':  # 'B' = BUY
-            side = OrderSide.BUY
-        else:
-            # Fallback - this shouldn't happen with proper API data
-            side = OrderSide.BUY
+        # Map side code; BUY is a fallback that shouldn't happen with proper API data
+        side = _ORDER_SIDES.get(data.get('side'), OrderSide.BUY)
         
         return cls(
             symbol=symbol,
@@ -89,7 +83,7 @@ class Order:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderFill:
     """Represents an executed order fill."""
     
@@ -101,6 +95,11 @@ class OrderFill:
     fee: float
     closed_pnl: float
     
+    # formatted_timestamp, filled in on first access (slots rule out cached_property)
+    _formatted_timestamp: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     @classmethod
     def from_api_data(cls, data: dict) -> 'OrderFill':
         """Create OrderFill from Hyperliquid API data."""
@@ -119,13 +118,8 @@ class OrderFill:
         else:
             timestamp = datetime.now(timezone.utc)
         
-        # Map side correctly for TAKER/MAKER roles
-        if side_code == 'A':  # 'A' = TAKER (aggressor)
-            role = FillRole.TAKER
-        elif side_code == 'B':  # 'B' = MAKER (passive)
-            role = FillRole.MAKER
-        else:
-            role = FillRole.TAKER  # Default fallback
+        # Map side code to TAKER/MAKER role (TAKER is the fallback)
+        role = _FILL_ROLES.get(side_code, FillRole.TAKER)
         
         return cls(
             symbol=symbol,
@@ -150,7 +144,10 @@ class OrderFill:
     @property
     def formatted_timestamp(self) -> str:
         """Get formatted timestamp string."""
-        return self.timestamp.strftime('%m/%d/%Y - %H:%M:%S')
+        formatted = self._formatted_timestamp
+        if formatted is None:
+            formatted = self._formatted_timestamp = self.timestamp.strftime('%m/%d/%Y - %H:%M:%S')
+        return formatted
     
     def to_dict(self) -> dict:
         """Convert order fill to dictionary."""
@@ -13,7 +13,7 @@ class PositionSide(Enum):
     SHORT = "SHORT"
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents a trading position."""
     
@@ -37,15 +37,13 @@ class Position:
         if szi_value is None:
             raise ValueError("Position size (szi) is None")
         
-        size = abs(float(szi_value))
-        side = PositionSide.LONG if float(szi_value) > 0 else PositionSide.SHORT
+        # Parse the signed size once and derive side/size from it
+        szi = float(szi_value)
+        side = PositionSide.LONG if szi > 0 else PositionSide.SHORT
+        size = szi if szi > 0 else -szi
         
-        # Extract leverage value from nested structure with null checks
-        leverage_data = position_data.get("leverage", {})
-        if isinstance(leverage_data, dict):
-            leverage_value = leverage_data.get("value", 1)
-        else:
-            leverage_value = leverage_data
+        # Leverage is always returned as a {"type": ..., "value": ...} object
+        leverage_value = (position_data.get("leverage") or {}).get("value", 1)
         
         # Safely convert all numeric fields with null checks
         entry_px = position_data.get("entryPx", 0)
@@ -53,12 +51,16 @@ class Position:
         unrealized_pnl = position_data.get("unrealizedPnl", 0)
         margin_used = position_data.get("marginUsed", 0)
         
+        # positionValue is |szi| * mark price, so the mark can be derived locally
+        position_value = position_data.get("positionValue")
+        mark_price = float(position_value) / size if position_value is not None and size else 0.0
+        
         return cls(
             symbol=position_data.get('coin', 'Unknown'),
             side=side,
             size=size,
             entry_price=float(entry_px) if entry_px is not None else 0.0,
-            mark_price=0.0,  # Will be updated separately
+            mark_price=mark_price,  # 0.0 when unavailable, filled in from allMids
             liq_price=float(liq_px) if liq_px is not None else 0.0,
             unrealized_pnl=float(unrealized_pnl) if unrealized_pnl is not None else 0.0,
             leverage=float(leverage_value) if leverage_value is not None else 1.0,
@@ -68,8 +70,9 @@ class Position:
     @property
     def pnl_percentage(self) -> float:
         """Calculate PnL percentage."""
-        if self.size * self.entry_price > 0:
-            return (self.unrealized_pnl / (self.size * self.entry_price)) * 100
+        notional = self.size * self.entry_price
+        if notional > 0:
+            return (self.unrealized_pnl / notional) * 100
         return 0.0
     
     @property
@@ -82,6 +85,21 @@ class Position:
         """Calculate current position value."""
         return self.size * self.mark_price
     
+    def to_display_row(self) -> tuple[str, ...]:
+        """Preformatted cell text: symbol, side, size, entry, mark, liq, P&L, P&L %, leverage, margin."""
+        return (
+            self.symbol,
+            self.side.value,
+            f"{self.size:,.4f}",
+            f"${self.entry_price:,.4f}",
+            f"${self.mark_price:,.4f}",
+            f"${self.liq_price:,.4f}",
+            f"${self.unrealized_pnl:+,.2f}",
+            f"{self.pnl_percentage:+.2f}%",
+            f"{self.leverage:.1f}x",
+            f"${self.margin_used:,.2f}"
+        )
+    
     def update_mark_price(self, mark_price: float) -> None:
         """Update the mark price for this position."""
         self.mark_price = mark_price
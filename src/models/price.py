@@ -2,18 +2,22 @@
 Price data model.
 """
 
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, KeysView, List, Optional
 
+# Prices older than this are considered stale by default (seconds)
+DEFAULT_MAX_PRICE_AGE = 60.0
 
-@dataclass
+
+@dataclass(slots=True)
 class PriceData:
     """Represents price data for a symbol."""
     
     symbol: str
     price: float
-    timestamp: datetime
+    timestamp_monotonic: float  # time.monotonic() when the price was fetched
     
     @classmethod
     def from_api_data(cls, symbol: str, price: float) -> 'PriceData':
@@ -21,7 +25,7 @@ class PriceData:
         return cls(
             symbol=symbol,
             price=price,
-            timestamp=datetime.now(timezone.utc)
+            timestamp_monotonic=time.monotonic()
         )
     
     @property
@@ -32,12 +36,20 @@ class PriceData:
     @property
     def age_seconds(self) -> float:
         """Get age of price data in seconds."""
-        return (datetime.now(timezone.utc) - self.timestamp).total_seconds()
+        return time.monotonic() - self.timestamp_monotonic
     
     @property
-    def is_stale(self, max_age_seconds: int = 60) -> bool:
-        """Check if price data is stale."""
-        return self.age_seconds > max_age_seconds
+    def timestamp_iso(self) -> str:
+        """Get the wall-clock fetch time as an ISO 8601 UTC string."""
+        return datetime.fromtimestamp(time.time() - self.age_seconds, timezone.utc).isoformat()
+    
+    def is_stale(
+        self, max_age_seconds: float = DEFAULT_MAX_PRICE_AGE, now: Optional[float] = None
+    ) -> bool:
+        """Check if price data is stale as of `now`, a time.monotonic() reading."""
+        if now is None:
+            now = time.monotonic()
+        return now - self.timestamp_monotonic > max_age_seconds
     
     def to_dict(self) -> dict:
         """Convert price data to dictionary."""
@@ -45,7 +57,7 @@ class PriceData:
             'symbol': self.symbol,
             'price': self.price,
             'formatted_price': self.formatted_price,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp_iso,
             'age_seconds': self.age_seconds,
             'is_stale': self.is_stale()
         }
@@ -70,10 +82,18 @@ class PriceCollection:
         price_data = self.get_price(symbol)
         return price_data.price if price_data else None
     
+    def get_price_map(self) -> Dict[str, float]:
+        """Get a symbol to price value mapping."""
+        return {symbol: price_data.price for symbol, price_data in self._prices.items()}
+    
     def has_symbol(self, symbol: str) -> bool:
         """Check if symbol exists in collection."""
         return symbol in self._prices
     
+    def keys(self) -> KeysView[str]:
+        """Get a live view of the symbols in collection."""
+        return self._prices.keys()
+    
     def get_symbols(self) -> List[str]:
         """Get all symbols in collection."""
         return list(self._prices.keys())
@@ -90,11 +110,13 @@ class PriceCollection:
             if symbol in self._prices
         }
     
-    def remove_stale_prices(self, max_age_seconds: int = 60) -> int:
+    def remove_stale_prices(self, max_age_seconds: float = DEFAULT_MAX_PRICE_AGE) -> int:
         """Remove stale prices and return count removed."""
+        # Anything fetched before this monotonic reading is stale
+        threshold = time.monotonic() - max_age_seconds
         stale_symbols = [
             symbol for symbol, price_data in self._prices.items()
-            if price_data.is_stale(max_age_seconds)
+            if price_data.timestamp_monotonic < threshold
         ]
         
         for symbol in stale_symbols:
@@ -3,7 +3,11 @@ Position monitor for automated data collection and reporting.
 """
 
 import asyncio
+import hashlib
 import logging
+import math
+import random
+from operator import attrgetter
 from typing import Optional, List
 from datetime import datetime
 
@@ -12,9 +16,30 @@ from ..services.position_service import PositionService
 from ..services.telegram_service import TelegramService
 from ..formatters.telegram_formatter import TelegramFormatter
 from ..formatters.console_formatter import ConsoleFormatter
-from ..models.position import Position
+from ..models.position import Position, PositionSide
 from ..models.account import AccountSummary
 
+# Backoff between failed monitor cycles (seconds)
+RETRY_BACKOFF_BASE = 2
+RETRY_BACKOFF_MAX = 30
+RETRY_JITTER = 0.5
+
+# Random offset applied to each refresh sleep to desynchronize instances (seconds)
+REFRESH_JITTER = 5
+
+# Monitor cycles between periodic updates (1 hour with 5min intervals)
+PERIODIC_UPDATE_CYCLES = 12
+
+# Unchanged periodic updates are re-sent at most this often (seconds)
+PERIODIC_HEARTBEAT_SECONDS = 3600
+
+# A P&L move between cycles is alerted when it exceeds either threshold
+PNL_ALERT_MIN_CHANGE = 100
+PNL_ALERT_MIN_CHANGE_PCT = 5
+
+_symbol_key = attrgetter("symbol")
+_pnl_key = attrgetter("unrealized_pnl")
+
 
 class PositionMonitor:
     """Monitors positions and sends periodic updates."""
@@ -34,99 +59,160 @@ class PositionMonitor:
         self.running = False
         self.last_positions: Optional[List[Position]] = None
         self.last_account: Optional[AccountSummary] = None
+        self._last_pnl_by_symbol: dict[str, float] = {}
         self.update_count = 0
+        self._last_periodic_hash: Optional[bytes] = None
+        
+        # Unchanged periodic updates skipped in a row, and how many make a heartbeat
+        self._periodic_skipped = 0
+        self._heartbeat_cycles = max(1, math.ceil(
+            PERIODIC_HEARTBEAT_SECONDS / (PERIODIC_UPDATE_CYCLES * settings.refresh_interval)
+        ))
     
     async def start(self) -> None:
         """Start the position monitor."""
         self.running = True
         self.logger.info("📊 Position monitor started")
         
+        # Spread the first fetch of multiple instances started together
+        if self.settings.boot_stagger_seconds > 0:
+            delay = random.uniform(0, self.settings.boot_stagger_seconds)
+            self.logger.info(f"⏳ Staggering first monitor cycle by {delay:.1f}s")
+            await asyncio.sleep(delay)
+        
+        failures = 0
         while self.running:
             try:
-                await self._monitor_cycle()
-                await asyncio.sleep(self.settings.refresh_interval)
+                if await self._monitor_cycle():
+                    failures = 0
+                    await asyncio.sleep(self._refresh_delay())
+                else:
+                    failures += 1
+                    await asyncio.sleep(self._retry_delay(failures))
                 
             except asyncio.CancelledError:
                 self.logger.info("🛑 Position monitor cancelled")
                 break
             except Exception as e:
                 self.logger.error(f"❌ Error in monitor cycle: {e}")
-                await asyncio.sleep(30)  # Wait before retrying
+                failures += 1
+                await asyncio.sleep(self._retry_delay(failures))
+    
+    def _refresh_delay(self) -> float:
+        """Refresh interval with a small random offset."""
+        jitter = random.uniform(-REFRESH_JITTER, REFRESH_JITTER)
+        return max(1.0, self.settings.refresh_interval + jitter)
+    
+    def _retry_delay(self, failures: int) -> float:
+        """Exponential backoff with jitter, never longer than the refresh interval."""
+        delay = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** (failures - 1))
+        delay = min(delay, self.settings.refresh_interval)
+        return delay + random.uniform(0, RETRY_JITTER)
     
     async def stop(self) -> None:
         """Stop the position monitor."""
         self.running = False
         self.logger.info("🛑 Position monitor stopped")
     
-    async def _monitor_cycle(self) -> None:
-        """Execute one monitoring cycle."""
+    async def _monitor_cycle(self) -> bool:
+        """Execute one monitoring cycle. Returns False if data could not be fetched."""
         self.update_count += 1
         self.logger.info(f"🔄 Starting monitor cycle #{self.update_count}")
         
         try:
             # Fetch fresh data
-            positions, account_summary = self.position_service.get_positions_and_account(
+            positions, account_summary = await self.position_service.get_positions_and_account_async(
                 use_cache=False,  # Always fetch fresh data for monitoring
                 force_refresh=True
             )
             
             if positions is None or account_summary is None:
                 self.logger.error("❌ Failed to fetch position data in monitor cycle")
-                return
+                return False
+            
+            # One timestamp for everything reported in this cycle
+            now = datetime.now()
             
             # Display to console
-            await self._display_console_update(positions, account_summary)
+            await self._display_console_update(positions, account_summary, now)
             
             # Check for significant changes and send Telegram updates
-            await self._check_and_send_updates(positions, account_summary)
+            await self._check_and_send_updates(positions, account_summary, now)
             
             # Update last known state
             self.last_positions = positions
             self.last_account = account_summary
+            self._last_pnl_by_symbol = dict(zip(map(_symbol_key, positions), map(_pnl_key, positions)))
             
             # Cleanup cache periodically
             if self.update_count % 10 == 0:  # Every 10 cycles
                 self._cleanup_cache()
             
+            return True
+            
         except Exception as e:
             self.logger.error(f"❌ Error in monitor cycle: {e}")
+            return False
     
     async def _display_console_update(
         self, 
         positions: List[Position], 
-        account_summary: AccountSummary
+        account_summary: AccountSummary,
+        now: datetime
     ) -> None:
         """Display update to console."""
+        # Headless deployments never see the tables, so skip building them
+        if not self.settings.enable_console_output:
+            return
+        
         try:
-            # Calculate portfolio metrics
-            portfolio_metrics = self.position_service.calculate_portfolio_metrics(
-                positions, account_summary
+            # Render off the event loop so a slow terminal does not stall the bot
+            await asyncio.to_thread(
+                self._render_console_update, positions, account_summary, now
             )
-            
+        except Exception as e:
+            self.logger.error(f"❌ Error displaying console update: {e}")
+    
+    def _render_console_update(
+        self, 
+        positions: List[Position], 
+        account_summary: AccountSummary,
+        now: datetime
+    ) -> None:
+        """Render and write one console refresh (runs in a worker thread)."""
+        # Nothing to redraw if the numbers are the same as last refresh
+        if self.console_formatter.positions_unchanged(positions, account_summary):
+            return
+        
+        # Calculate portfolio metrics
+        portfolio_metrics = self.position_service.calculate_portfolio_metrics(
+            positions, account_summary
+        )
+        
+        # Buffer the whole refresh so it reaches the terminal in one write
+        with self.console_formatter.console:
             # Print separator and timestamp
             self.console_formatter.print_separator()
             self.console_formatter.print_info(
-                f"Monitor Update #{self.update_count} - {datetime.now().strftime('%H:%M:%S')}"
+                f"Monitor Update #{self.update_count} - {now:%H:%M:%S}"
             )
             
             # Display positions summary
             self.console_formatter.format_positions_summary(
                 positions, account_summary, portfolio_metrics
             )
-            
-        except Exception as e:
-            self.logger.error(f"❌ Error displaying console update: {e}")
     
     async def _check_and_send_updates(
         self, 
         positions: List[Position], 
-        account_summary: AccountSummary
+        account_summary: AccountSummary,
+        now: datetime
     ) -> None:
         """Check for significant changes and send Telegram updates."""
         try:
-            # Send periodic updates (every 12 cycles = 1 hour with 5min intervals)
-            if self.update_count % 12 == 0:
-                await self._send_periodic_update(positions, account_summary)
+            # Send periodic updates
+            if self.update_count % PERIODIC_UPDATE_CYCLES == 0:
+                await self._send_periodic_update(positions, account_summary, now)
                 return
             
             # Check for significant changes
@@ -134,13 +220,11 @@ class PositionMonitor:
                 # First run - don't send update
                 return
             
-            # Check for new positions
-            new_positions = self._detect_new_positions(positions)
+            # Check for new and closed positions
+            new_positions, closed_positions = self._detect_position_changes(positions)
             if new_positions:
                 await self._send_new_positions_alert(new_positions)
             
-            # Check for closed positions
-            closed_positions = self._detect_closed_positions(positions)
             if closed_positions:
                 await self._send_closed_positions_alert(closed_positions)
             
@@ -155,25 +239,38 @@ class PositionMonitor:
     async def _send_periodic_update(
         self, 
         positions: List[Position], 
-        account_summary: AccountSummary
+        account_summary: AccountSummary,
+        now: datetime
     ) -> None:
         """Send periodic position update."""
         try:
-            self.logger.info("📱 Sending periodic position update")
-            
             # Calculate portfolio metrics
             portfolio_metrics = self.position_service.calculate_portfolio_metrics(
                 positions, account_summary
             )
             
-            # Format message with periodic update header
-            message = f"🕐 *Periodic Update* - {datetime.now().strftime('%H:%M')}\n\n"
-            message += TelegramFormatter.format_positions_message(
+            body = TelegramFormatter.format_positions_message(
                 positions, account_summary, portfolio_metrics
             )
             
-            success = self.telegram_service.send_message(message)
+            # Skip identical updates until a heartbeat's worth of periodic cycles has
+            # passed; counting cycles keeps refresh jitter from delaying the heartbeat
+            body_hash = hashlib.blake2b(body.encode(), digest_size=16).digest()
+            if (body_hash == self._last_periodic_hash
+                    and self._periodic_skipped + 1 < self._heartbeat_cycles):
+                self._periodic_skipped += 1
+                self.logger.info("⏭️ Skipping periodic update, nothing changed")
+                return
+            
+            self.logger.info("📱 Sending periodic position update")
+            
+            # Prepend the periodic update header
+            message = f"🕐 *Periodic Update* - {now:%H:%M}\n\n{body}"
+            
+            success = await self.telegram_service.send_message_async(message)
             if success:
+                self._last_periodic_hash = body_hash
+                self._periodic_skipped = 0
                 self.logger.info("✅ Periodic update sent successfully")
             else:
                 self.logger.warning("⚠️ Failed to send periodic update")
@@ -181,60 +278,52 @@ class PositionMonitor:
         except Exception as e:
             self.logger.error(f"❌ Error sending periodic update: {e}")
     
-    def _detect_new_positions(self, current_positions: List[Position]) -> List[Position]:
-        """Detect new positions that weren't in the last update."""
+    def _detect_position_changes(
+        self, 
+        current_positions: List[Position]
+    ) -> tuple[List[Position], List[Position]]:
+        """Detect positions opened and closed since the last update."""
         if not self.last_positions:
-            return []
+            return [], []
         
-        last_symbols = {pos.symbol for pos in self.last_positions}
-        new_positions = [
-            pos for pos in current_positions 
-            if pos.symbol not in last_symbols
-        ]
+        # Symbols from the previous cycle, already kept as the P&L map's keys
+        last_symbols = self._last_pnl_by_symbol.keys()
+        current_symbols = set(map(_symbol_key, current_positions))
+        if current_symbols == last_symbols:
+            return [], []
         
-        return new_positions
-    
-    def _detect_closed_positions(self, current_positions: List[Position]) -> List[Position]:
-        """Detect positions that were closed since last update."""
-        if not self.last_positions:
-            return []
-        
-        current_symbols = {pos.symbol for pos in current_positions}
+        new_positions = [pos for pos in current_positions if pos.symbol not in last_symbols]
         closed_positions = [
             pos for pos in self.last_positions 
             if pos.symbol not in current_symbols
         ]
         
-        return closed_positions
+        return new_positions, closed_positions
     
     def _detect_significant_pnl_changes(self, current_positions: List[Position]) -> List[dict]:
         """Detect significant PnL changes (>5% change or >$100)."""
-        if not self.last_positions:
+        # P&L by symbol from the previous cycle, kept up to date by _monitor_cycle
+        last_pnls = self._last_pnl_by_symbol
+        if not last_pnls:
             return []
         
-        # Create lookup for last positions
-        last_pos_lookup = {pos.symbol: pos for pos in self.last_positions}
-        
         significant_changes = []
         
         for current_pos in current_positions:
-            last_pos = last_pos_lookup.get(current_pos.symbol)
-            if not last_pos:
+            previous_pnl = last_pnls.get(current_pos.symbol)
+            if previous_pnl is None:
                 continue
             
-            pnl_change = current_pos.unrealized_pnl - last_pos.unrealized_pnl
-            pnl_change_pct = 0
-            
-            if last_pos.unrealized_pnl != 0:
-                pnl_change_pct = (pnl_change / abs(last_pos.unrealized_pnl)) * 100
+            pnl_change = current_pos.unrealized_pnl - previous_pnl
+            pnl_change_pct = (pnl_change / abs(previous_pnl)) * 100 if previous_pnl else 0
             
             # Check if change is significant
-            if abs(pnl_change) > 100 or abs(pnl_change_pct) > 5:
+            if abs(pnl_change) > PNL_ALERT_MIN_CHANGE or abs(pnl_change_pct) > PNL_ALERT_MIN_CHANGE_PCT:
                 significant_changes.append({
                     'position': current_pos,
                     'pnl_change': pnl_change,
                     'pnl_change_pct': pnl_change_pct,
-                    'previous_pnl': last_pos.unrealized_pnl
+                    'previous_pnl': previous_pnl
                 })
         
         return significant_changes
@@ -244,15 +333,20 @@ class PositionMonitor:
         try:
             self.logger.info(f"🆕 Sending new positions alert for {len(new_positions)} positions")
             
-            message = f"🆕 *New Position{'s' if len(new_positions) > 1 else ''}*\n\n"
+            # Collect message parts and join once at the end
+            parts = [f"🆕 *New Position{'s' if len(new_positions) > 1 else ''}*\n\n"]
+            ap = parts.append
             
             for pos in new_positions:
-                side_emoji = "📈" if pos.side.value == "LONG" else "📉"
-                message += f"{side_emoji} *{pos.symbol}* {pos.side.value}\n"
-                message += f"   Size: {pos.size:,.4f} @ ${pos.entry_price:,.4f}\n"
-                message += f"   Leverage: {pos.leverage:.1f}x\n\n"
+                side = pos.side
+                side_emoji = "📈" if side is PositionSide.LONG else "📉"
+                ap(f"{side_emoji} *{pos.symbol}* {side.value}\n"
+                   f"   Size: {pos.size:,.4f} @ ${pos.entry_price:,.4f}\n"
+                   f"   Leverage: {pos.leverage:.1f}x\n\n")
+            
+            message = "".join(parts)
             
-            success = self.telegram_service.send_message(message)
+            success = await self.telegram_service.send_message_async(message)
             if success:
                 self.logger.info("✅ New positions alert sent")
             else:
@@ -266,15 +360,21 @@ class PositionMonitor:
         try:
             self.logger.info(f"🔒 Sending closed positions alert for {len(closed_positions)} positions")
             
-            message = f"🔒 *Position{'s' if len(closed_positions) > 1 else ''} Closed*\n\n"
+            # Collect message parts and join once at the end
+            parts = [f"🔒 *Position{'s' if len(closed_positions) > 1 else ''} Closed*\n\n"]
+            ap = parts.append
             
             for pos in closed_positions:
-                pnl_emoji = "🟢" if pos.is_profitable else "🔴"
-                side_emoji = "📈" if pos.side.value == "LONG" else "📉"
-                message += f"{side_emoji} *{pos.symbol}* {pos.side.value}\n"
-                message += f"   {pnl_emoji} Final P&L: ${pos.unrealized_pnl:+,.2f}\n\n"
+                side = pos.side
+                pnl = pos.unrealized_pnl
+                pnl_emoji = "🟢" if pnl >= 0 else "🔴"
+                side_emoji = "📈" if side is PositionSide.LONG else "📉"
+                ap(f"{side_emoji} *{pos.symbol}* {side.value}\n"
+                   f"   {pnl_emoji} Final P&L: ${pnl:+,.2f}\n\n")
+            
+            message = "".join(parts)
             
-            success = self.telegram_service.send_message(message)
+            success = await self.telegram_service.send_message_async(message)
             if success:
                 self.logger.info("✅ Closed positions alert sent")
             else:
@@ -292,25 +392,27 @@ class PositionMonitor:
         try:
             self.logger.info(f"📊 Sending PnL change alert for {len(significant_changes)} positions")
             
-            message = f"📊 *Significant P&L Change{'s' if len(significant_changes) > 1 else ''}*\n\n"
+            # Collect message parts and join once at the end
+            parts = [f"📊 *Significant P&L Change{'s' if len(significant_changes) > 1 else ''}*\n\n"]
+            ap = parts.append
             
             for change in significant_changes:
                 pos = change['position']
                 pnl_change = change['pnl_change']
                 pnl_change_pct = change['pnl_change_pct']
                 
+                side = pos.side
                 change_emoji = "🟢" if pnl_change > 0 else "🔴"
-                side_emoji = "📈" if pos.side.value == "LONG" else "📉"
+                side_emoji = "📈" if side is PositionSide.LONG else "📉"
+                pct_text = f" ({pnl_change_pct:+.1f}%)" if pnl_change_pct != 0 else ""
                 
-                message += f"{side_emoji} *{pos.symbol}* {pos.side.value}\n"
-                message += f"   {change_emoji} Change: ${pnl_change:+,.2f}"
-                
-                if pnl_change_pct != 0:
-                    message += f" ({pnl_change_pct:+.1f}%)"
-                
-                message += f"\n   Current P&L: ${pos.unrealized_pnl:+,.2f}\n\n"
+                ap(f"{side_emoji} *{pos.symbol}* {side.value}\n"
+                   f"   {change_emoji} Change: ${pnl_change:+,.2f}{pct_text}\n"
+                   f"   Current P&L: ${pos.unrealized_pnl:+,.2f}\n\n")
+            
+            message = "".join(parts)
             
-            success = self.telegram_service.send_message(message)
+            success = await self.telegram_service.send_message_async(message)
             if success:
                 self.logger.info("✅ PnL change alert sent")
             else:
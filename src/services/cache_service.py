@@ -45,29 +45,29 @@ class CacheService:
             entry = self._cache.get(key)
             
             if entry is None:
-                self.logger.debug(f"Cache miss for key: {key}")
+                self.logger.debug("Cache miss for key: %s", key)
                 return None
             
             if entry.is_expired(max_age):
-                self.logger.debug(f"Cache expired for key: {key} (age: {entry.age:.1f}s)")
+                self.logger.debug("Cache expired for key: %s (age: %.1fs)", key, entry.age)
                 del self._cache[key]
                 return None
             
-            self.logger.debug(f"Cache hit for key: {key} (age: {entry.age:.1f}s)")
+            self.logger.debug("Cache hit for key: %s (age: %.1fs)", key, entry.age)
             return entry.data
     
     def set(self, key: str, data: Any) -> None:
         """Store data in cache with current timestamp."""
         with self._lock:
             self._cache[key] = CacheEntry(data=data, timestamp=time.time())
-            self.logger.debug(f"Cached data for key: {key}")
+            self.logger.debug("Cached data for key: %s", key)
     
     def delete(self, key: str) -> bool:
         """Delete cached data."""
         with self._lock:
             if key in self._cache:
                 del self._cache[key]
-                self.logger.debug(f"Deleted cache entry for key: {key}")
+                self.logger.debug("Deleted cache entry for key: %s", key)
                 return True
             return False
     
@@ -80,7 +80,7 @@ class CacheService:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
-            self.logger.info(f"Cleared {count} cache entries")
+            self.logger.info("Cleared %s cache entries", count)
             return count
     
     def cleanup_expired(self, max_age: Optional[float] = None) -> int:
@@ -98,7 +98,7 @@ class CacheService:
                 del self._cache[key]
             
             if expired_keys:
-                self.logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+                self.logger.info("Cleaned up %d expired cache entries", len(expired_keys))
             
             return len(expired_keys)
     
@@ -156,7 +156,7 @@ class PositionCacheService(CacheService):
     def cache_positions(self, positions: list) -> None:
         """Cache position data."""
         self.set(self.POSITIONS_KEY, positions)
-        self.logger.debug(f"Cached {len(positions)} positions")
+        self.logger.debug("Cached %d positions", len(positions))
     
     def get_positions(self, max_age: Optional[float] = None) -> Optional[list]:
         """Get cached positions."""
@@ -183,7 +183,7 @@ class PositionCacheService(CacheService):
     def cache_fills(self, fills: list) -> None:
         """Cache user fills data."""
         self.set(self.FILLS_KEY, fills)
-        self.logger.debug(f"Cached {len(fills)} fills")
+        self.logger.debug("Cached %d fills", len(fills))
     
     def get_fills(self, max_age: Optional[float] = None) -> Optional[list]:
         """Get cached fills."""
@@ -192,7 +192,7 @@ class PositionCacheService(CacheService):
     def cache_orders(self, orders: list) -> None:
         """Cache open orders data."""
         self.set(self.ORDERS_KEY, orders)
-        self.logger.debug(f"Cached {len(orders)} orders")
+        self.logger.debug("Cached %d orders", len(orders))
     
     def get_orders(self, max_age: Optional[float] = None) -> Optional[list]:
         """Get cached orders."""
@@ -211,7 +211,7 @@ class PositionCacheService(CacheService):
             if self.delete(key):
                 deleted_count += 1
         
-        self.logger.info(f"Invalidated {deleted_count} position data cache entries")
+        self.logger.info("Invalidated %s position data cache entries", deleted_count)
     
     def has_fresh_position_data(self, max_age: Optional[float] = None) -> bool:
         """Check if we have fresh position and account data."""
@@ -0,0 +1,48 @@
+"""
+Shared HTTP session factory for external API services.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(
+    pool_size: int = 10,
+    max_retries: int = 5,
+    backoff_factor: float = 0.5,
+    retry_post: bool = False
+) -> requests.Session:
+    """
+    Create a pooled session that keeps connections alive between requests.
+
+    Args:
+        pool_size: Number of connections kept open per host
+        max_retries: Retries for connection errors and transient status codes
+        backoff_factor: Base delay for exponential backoff between retries
+            (429 responses honour the Retry-After header instead)
+        retry_post: Also retry POST requests (only safe for idempotent endpoints)
+
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=None if retry_post else Retry.DEFAULT_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
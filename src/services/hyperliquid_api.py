@@ -2,8 +2,10 @@
 Hyperliquid API service for data retrieval.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+import orjson
 import requests
 
 from ..config.settings import Settings
@@ -11,6 +13,7 @@ from ..models.position import Position
 from ..models.account import AccountSummary
 from ..models.order import Order, OrderFill
 from ..models.price import PriceCollection
+from .http_session import create_session
 
 
 class HyperliquidAPIService:
@@ -19,119 +22,165 @@ class HyperliquidAPIService:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
-        self.session.timeout = settings.api_timeout
+        # The info endpoint is read-only, so POSTs are safe to retry
+        self.session = create_session(retry_post=True)
+        # Bodies are serialized with orjson, so the JSON header is set once here
+        self.session.headers["Content-Type"] = "application/json"
     
     def _make_request(self, payload: dict) -> Optional[dict]:
         """Make a request to the Hyperliquid API."""
         try:
-            self.logger.debug(f"Making API request: {payload}")
+            self.logger.debug("Making API request: %s", payload)
             response = self.session.post(
                 self.settings.api_base_url,
-                json=payload,
+                data=orjson.dumps(payload),
                 timeout=self.settings.api_timeout
             )
             response.raise_for_status()
             
-            data = response.json()
-            self.logger.debug(f"API response received: {len(str(data))} characters")
+            data = orjson.loads(response.content)
+            self.logger.debug("API response received: %d bytes", len(response.content))
             return data
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"API request failed: {e}")
+            self.logger.error("API request failed: %s", e)
             return None
         except Exception as e:
-            self.logger.error(f"Unexpected error in API request: {e}")
+            self.logger.error("Unexpected error in API request: %s", e)
             return None
     
-    def get_mark_prices(self) -> PriceCollection:
-        """Fetch all current mark prices."""
+    def get_all_mids(self) -> Optional[Dict[str, str]]:
+        """Fetch the raw allMids mapping of symbol to mid price string."""
         payload = {"type": "allMids"}
         
         self.logger.info("Fetching mark prices from Hyperliquid API...")
         data = self._make_request(payload)
         
+        # The allMids API returns a dictionary with symbol: price_string format
+        if not data or not isinstance(data, dict):
+            self.logger.error("Failed to fetch mark prices")
+            return None
+        
+        return data
+    
+    def get_mark_prices(self) -> PriceCollection:
+        """Fetch all current mark prices."""
+        data = self.get_all_mids()
+        
         price_collection = PriceCollection()
         
         if not data:
-            self.logger.error("Failed to fetch mark prices")
             return price_collection
         
-        # The allMids API returns a dictionary with symbol: price_string format
-        if isinstance(data, dict):
-            for symbol, price_str in data.items():
-                try:
-                    # Skip entries that start with '@' (these are index-based entries)
-                    if not symbol.startswith('@'):
-                        price = float(price_str)
-                        price_collection.add_price(symbol, price)
-                except (ValueError, TypeError) as e:
-                    self.logger.warning(f"Failed to parse price for {symbol}: {e}")
-                    continue
-        
-        self.logger.info(f"Fetched {len(price_collection)} token prices")
+        for symbol, price_str in data.items():
+            # Skip entries that start with '@' (these are index-based entries)
+            if symbol.startswith('@'):
+                continue
+            try:
+                price_collection.add_price(symbol, float(price_str))
+            except (ValueError, TypeError) as e:
+                self.logger.warning("Failed to parse price for %s: %s", symbol, e)
+                continue
+        
+        self.logger.info("Fetched %d token prices", len(price_collection))
         return price_collection
     
-    def get_positions(self) -> List[Position]:
-        """Fetch perpetual positions."""
+    def get_clearinghouse_state(self) -> Optional[dict]:
+        """Fetch the raw clearinghouse state (positions and margin summary)."""
         payload = {
             "type": "clearinghouseState",
             "user": self.settings.wallet_address
         }
         
-        self.logger.info("Fetching positions from Hyperliquid API...")
-        data = self._make_request(payload)
+        self.logger.info("Fetching clearinghouse state from Hyperliquid API...")
+        return self._make_request(payload)
+    
+    def get_positions_and_account(
+        self, 
+        mids: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Optional[List[Position]], Optional[AccountSummary]]:
+        """Fetch positions and account summary from a single clearinghouseState request."""
+        state = self.get_clearinghouse_state()
+        if not state:
+            self.logger.error("Failed to fetch clearinghouse state")
+            return None, None
+        
+        positions = self.get_positions(state, mids)
+        account_summary = self.get_account_summary(state)
+        return positions, account_summary
+    
+    def get_positions(
+        self, 
+        state: Optional[dict] = None, 
+        mids: Optional[Dict[str, Any]] = None
+    ) -> List[Position]:
+        """Fetch perpetual positions, reusing pre-fetched state and allMids if given.
+        
+        Mark prices come from each position's positionValue; allMids is only
+        consulted for positions where that is missing.
+        """
+        data = state if state is not None else self.get_clearinghouse_state()
         
         if not data:
             self.logger.error("Failed to fetch positions")
             return []
         
         positions_data = data.get('assetPositions', [])
-        self.logger.info(f"Found {len(positions_data)} positions in API response")
+        self.logger.info("Found %d positions in API response", len(positions_data))
         
         # Filter out zero-size positions and create Position objects
         active_positions = []
-        symbols_to_fetch = []
         
         for pos_data in positions_data:
             try:
-                # Check if position has size
-                position_info = pos_data.get("position", {})
-                szi_value = position_info.get("szi")
+                if pos_data.get("position", {}).get("szi") is None:
+                    continue  # Skip entries without a size
                 
-                if szi_value is None or abs(float(szi_value)) == 0:
+                position = Position.from_api_data(pos_data)
+                if position.size == 0:
                     continue  # Skip zero-size positions
                 
-                position = Position.from_api_data(pos_data)
                 active_positions.append(position)
-                symbols_to_fetch.append(position.symbol)
                 
             except (ValueError, KeyError) as e:
-                self.logger.warning(f"Failed to parse position data: {e}")
+                self.logger.warning("Failed to parse position data: %s", e)
                 continue
         
-        # Fetch mark prices for all symbols and update positions
-        if symbols_to_fetch:
+        # Nothing to price on an idle account
+        if not active_positions:
+            self.logger.info("No active positions")
+            return active_positions
+        
+        unpriced = [p for p in active_positions if p.mark_price == 0]
+        if not unpriced:
+            self.logger.info("Successfully processed %d active positions", len(active_positions))
+            return active_positions
+        
+        # Fall back to the allMids mapping for positions without a derived mark price
+        if mids is None:
             self.logger.info("Fetching current mark prices for positions...")
-            price_collection = self.get_mark_prices()
-            
-            for position in active_positions:
-                mark_price = price_collection.get_price_value(position.symbol)
-                if mark_price:
-                    position.update_mark_price(mark_price)
+            mids = self.get_all_mids() or {}
+        
+        missing = []
+        for position in unpriced:
+            mid = mids.get(position.symbol)
+            if mid is None:
+                missing.append(position.symbol)
+                continue
+            try:
+                position.update_mark_price(float(mid))
+            except (ValueError, TypeError) as e:
+                self.logger.warning("Failed to parse price for %s: %s", position.symbol, e)
+        
+        if missing:
+            self.logger.warning("No mark price available for positions: %s", ', '.join(missing))
         
-        self.logger.info(f"Successfully processed {len(active_positions)} active positions")
+        self.logger.info("Successfully processed %d active positions", len(active_positions))
         return active_positions
     
-    def get_account_summary(self) -> Optional[AccountSummary]:
-        """Fetch account summary."""
-        payload = {
-            "type": "clearinghouseState",
-            "user": self.settings.wallet_address
-        }
-        
-        self.logger.info("Fetching account metrics from Hyperliquid API...")
-        data = self._make_request(payload)
+    def get_account_summary(self, state: Optional[dict] = None) -> Optional[AccountSummary]:
+        """Fetch account summary, reusing a pre-fetched clearinghouse state if given."""
+        data = state if state is not None else self.get_clearinghouse_state()
         
         if not data:
             self.logger.error("Failed to fetch account metrics")
@@ -150,7 +199,7 @@ class HyperliquidAPIService:
             return account_summary
             
         except (ValueError, KeyError) as e:
-            self.logger.error(f"Failed to parse account data: {e}")
+            self.logger.error("Failed to parse account data: %s", e)
             return None
     
     def get_user_fills(self, limit: int = 10) -> List[OrderFill]:
@@ -179,10 +228,10 @@ class HyperliquidAPIService:
                 fill = OrderFill.from_api_data(fill_data)
                 fills.append(fill)
             except (ValueError, KeyError) as e:
-                self.logger.warning(f"Failed to parse fill data: {e}")
+                self.logger.warning("Failed to parse fill data: %s", e)
                 continue
         
-        self.logger.info(f"Successfully fetched {len(fills)} recent fills")
+        self.logger.info("Successfully fetched %d recent fills", len(fills))
         return fills
     
     def get_open_orders(self, limit: int = 10) -> List[Order]:
@@ -210,11 +259,11 @@ class HyperliquidAPIService:
                 order = Order.from_api_data(order_data)
                 orders.append(order)
             except (ValueError, KeyError) as e:
-                self.logger.warning(f"Failed to parse order data: {e}")
-                self.logger.debug(f"Raw order data: {order_data}")
+                self.logger.warning("Failed to parse order data: %s", e)
+                self.logger.debug("Raw order data: %s", order_data)
                 continue
         
-        self.logger.info(f"Successfully fetched {len(orders)} open orders")
+        self.logger.info("Successfully fetched %d open orders", len(orders))
         return orders
     
     def test_connectivity(self) -> bool:
@@ -226,13 +275,13 @@ class HyperliquidAPIService:
             test_payload = {"type": "allMids"}
             response = self.session.post(
                 self.settings.api_base_url,
-                json=test_payload,
+                data=orjson.dumps(test_payload),
                 timeout=10
             )
             
             if response.status_code == 200:
                 # Try to parse the response to ensure it's valid
-                data = response.json()
+                data = orjson.loads(response.content)
                 if isinstance(data, dict) and len(data) > 0:
                     self.logger.info("Hyperliquid API connectivity test passed")
                     return True
@@ -240,13 +289,17 @@ class HyperliquidAPIService:
                     self.logger.warning("Hyperliquid API returned empty or invalid data")
                     return False
             else:
-                self.logger.warning(f"Hyperliquid API returned status: {response.status_code}")
+                self.logger.warning("Hyperliquid API returned status: %s", response.status_code)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Hyperliquid API connectivity test failed: {e}")
+            self.logger.error("Hyperliquid API connectivity test failed: %s", e)
             return False
     
+    async def test_connectivity_async(self) -> bool:
+        """Test API connectivity without blocking the event loop."""
+        return await asyncio.to_thread(self.test_connectivity)
+    
     def close(self) -> None:
         """Close the session."""
         self.session.close()
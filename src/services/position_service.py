@@ -2,7 +2,9 @@
 Position service for business logic and data orchestration.
 """
 
+import asyncio
 import logging
+from operator import attrgetter
 from typing import List, Optional, Tuple
 
 from ..models.position import Position
@@ -12,6 +14,9 @@ from ..models.price import PriceCollection
 from .hyperliquid_api import HyperliquidAPIService
 from .cache_service import PositionCacheService
 
+_pnl_key = attrgetter("unrealized_pnl")
+_value_key = attrgetter("position_value")
+
 
 class PositionService:
     """Service for position-related business logic."""
@@ -40,8 +45,17 @@ class PositionService:
         # Fetch fresh data from API
         self.logger.info("Fetching fresh position and account data from API")
         
-        positions = self.api_service.get_positions()
-        account_summary = self.api_service.get_account_summary()
+        # Mark prices come from each position's positionValue; a still-fresh
+        # price snapshot only backs the allMids fallback for positions without one
+        mids = None
+        if use_cache and not force_refresh:
+            cached_prices = self.cache_service.get_prices()
+            if cached_prices is not None:
+                self.logger.debug("Using cached mark prices for positions")
+                mids = cached_prices.get_price_map()
+        
+        # Positions and margin summary come from one clearinghouseState payload
+        positions, account_summary = self.api_service.get_positions_and_account(mids)
         
         if positions is None or account_summary is None:
             self.logger.error("Failed to fetch position or account data")
@@ -55,6 +69,16 @@ class PositionService:
         
         return positions, account_summary
     
+    async def get_positions_and_account_async(
+        self, 
+        use_cache: bool = True, 
+        force_refresh: bool = False
+    ) -> Tuple[Optional[List[Position]], Optional[AccountSummary]]:
+        """Run get_positions_and_account in a worker thread so the event loop stays free."""
+        return await asyncio.to_thread(
+            self.get_positions_and_account, use_cache, force_refresh
+        )
+    
     def get_prices(
         self, 
         symbols: Optional[List[str]] = None, 
@@ -185,36 +209,48 @@ class PositionService:
                 }
             }
         
-        profitable_positions = [p for p in positions if p.is_profitable]
-        losing_positions = [p for p in positions if not p.is_profitable]
+        # Single pass over the positions for every aggregate
+        profitable_count = 0
+        total_unrealized_pnl = 0.0
+        max_single_loss = None
+        largest_position_value = 0.0
+        total_margin = 0.0
+        weighted_leverage_sum = 0.0
         
-        total_unrealized_pnl = sum(p.unrealized_pnl for p in positions)
-        position_values = [p.position_value for p in positions]
-        largest_position_value = max(position_values) if position_values else 0.0
+        for p in positions:
+            pnl = p.unrealized_pnl
+            margin = p.margin_used
+            position_value = p.size * p.mark_price
+            
+            if pnl >= 0:
+                profitable_count += 1
+            total_unrealized_pnl += pnl
+            if max_single_loss is None or pnl < max_single_loss:
+                max_single_loss = pnl
+            if position_value > largest_position_value:
+                largest_position_value = position_value
+            total_margin += margin
+            weighted_leverage_sum += p.leverage * margin
         
         # Calculate weighted average leverage
-        total_margin = sum(p.margin_used for p in positions)
-        if total_margin > 0:
-            weighted_leverage = sum(p.leverage * p.margin_used for p in positions) / total_margin
-        else:
-            weighted_leverage = 0.0
+        weighted_leverage = weighted_leverage_sum / total_margin if total_margin > 0 else 0.0
         
         # Risk metrics
         max_drawdown_risk = 0.0
         concentration_risk = 0.0
         
-        if account_summary.account_value > 0:
+        account_value = account_summary.account_value
+        if account_value > 0:
             # Max drawdown risk: largest single position loss potential
-            max_single_loss = min(p.unrealized_pnl for p in positions) if positions else 0.0
-            max_drawdown_risk = abs(max_single_loss) / account_summary.account_value * 100
+            max_drawdown_risk = abs(max_single_loss) / account_value * 100
             
             # Concentration risk: largest position as % of account
-            concentration_risk = largest_position_value / account_summary.account_value * 100
+            concentration_risk = largest_position_value / account_value * 100
         
         return {
             'total_positions': len(positions),
-            'profitable_positions': len(profitable_positions),
-            'losing_positions': len(losing_positions),
+            'profitable_positions': profitable_count,
+            'losing_positions': len(positions) - profitable_count,
             'total_unrealized_pnl': total_unrealized_pnl,
             'largest_position_value': largest_position_value,
             'average_leverage': weighted_leverage,
@@ -237,8 +273,8 @@ class PositionService:
     
     def sort_positions_by_pnl(self, positions: List[Position], descending: bool = True) -> List[Position]:
         """Sort positions by unrealized PnL."""
-        return sorted(positions, key=lambda p: p.unrealized_pnl, reverse=descending)
+        return sorted(positions, key=_pnl_key, reverse=descending)
     
     def sort_positions_by_size(self, positions: List[Position], descending: bool = True) -> List[Position]:
         """Sort positions by position value."""
-        return sorted(positions, key=lambda p: p.position_value, reverse=descending)
+        return sorted(positions, key=_value_key, reverse=descending)
@@ -2,11 +2,21 @@
 Telegram service for message sending and bot interactions.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
+import aiohttp
+import orjson
 import requests
 
 from ..config.settings import Settings
+from .http_session import create_session
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Seconds Telegram holds a getUpdates request open while waiting for updates
+LONG_POLL_TIMEOUT = 50
 
 
 class TelegramService:
@@ -15,92 +25,171 @@ class TelegramService:
     def __init__(self, settings: Settings):
         self.settings = settings
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
-        self.session.timeout = settings.api_timeout
+        self.session = create_session()
+        
+        # Endpoint URLs are fixed for the lifetime of the service
+        api_url = settings.telegram_api_url
+        self._send_message_url = f"{api_url}/sendMessage"
+        self._get_updates_url = f"{api_url}/getUpdates"
+        self._answer_callback_url = f"{api_url}/answerCallbackQuery"
+        self._set_webhook_url = f"{api_url}/setWebhook"
+        self._delete_webhook_url = f"{api_url}/deleteWebhook"
+        
+        # Created lazily inside the running event loop
+        self._async_session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """Get the keep-alive aiohttp session used for polling and sending."""
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=75)
+            )
+        return self._async_session
     
-    def send_message(
+    def _post_json(self, url: str, payload: dict, timeout: float) -> requests.Response:
+        """POST a JSON payload serialized with orjson."""
+        return self.session.post(url, data=orjson.dumps(payload), headers=JSON_HEADERS, timeout=timeout)
+    
+    async def _post_json_async(self, url: str, payload: dict, timeout: float) -> None:
+        """POST a JSON payload on the aiohttp session, raising on HTTP errors."""
+        session = self._get_async_session()
+        async with session.post(
+            url, 
+            data=orjson.dumps(payload), 
+            headers=JSON_HEADERS, 
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+    
+    async def send_message_async(
         self, 
         message: str, 
         parse_mode: str = "Markdown", 
         reply_markup: Optional[dict] = None
     ) -> bool:
-        """Send message to Telegram."""
+        """Send message to Telegram over the shared keep-alive session."""
         try:
-            url = f"{self.settings.telegram_api_url}/sendMessage"
-            
-            payload = {
-                'chat_id': self.settings.telegram_chat_id,
-                'text': message,
-                'parse_mode': parse_mode
-            }
+            url = self._send_message_url
+            payload = self._message_payload(message, parse_mode, reply_markup)
             
-            if reply_markup:
-                payload['reply_markup'] = reply_markup
-            
-            self.logger.debug(f"Sending Telegram message: {len(message)} characters")
-            response = self.session.post(url, json=payload, timeout=self.settings.api_timeout)
-            response.raise_for_status()
+            self.logger.debug("Sending Telegram message: %d characters", len(message))
+            await self._post_json_async(url, payload, self.settings.api_timeout)
             
             self.logger.info("Message sent to Telegram successfully")
             return True
             
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to send Telegram message: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.error("Failed to send Telegram message: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error sending message: {e}")
+            self.logger.error("Unexpected error sending message: %s", e)
             return False
     
-    def get_updates(self, offset: int = 0, timeout: int = 10, limit: int = 100) -> List[Dict]:
-        """Get updates from Telegram."""
+    def _message_payload(
+        self, 
+        message: str, 
+        parse_mode: str, 
+        reply_markup: Optional[dict]
+    ) -> dict:
+        """Build the sendMessage payload for the configured chat."""
+        payload = {
+            'chat_id': self.settings.telegram_chat_id,
+            'text': message,
+            'parse_mode': parse_mode
+        }
+        
+        if reply_markup:
+            payload['reply_markup'] = reply_markup
+        
+        return payload
+    
+    async def get_updates_async(
+        self, 
+        offset: int = 0, 
+        timeout: int = LONG_POLL_TIMEOUT, 
+        limit: int = 100
+    ) -> List[Dict]:
+        """
+        Long-poll Telegram for updates without blocking the event loop.
+        
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: On network or HTTP failures,
+                so the caller can back off
+        """
+        params = {
+            'offset': offset,
+            'timeout': timeout,
+            'limit': limit
+        }
+        
+        session = self._get_async_session()
+        async with session.get(
+            self._get_updates_url, 
+            params=params, 
+            timeout=aiohttp.ClientTimeout(total=timeout + 10)
+        ) as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
+        
+        if not data.get('ok'):
+            self.logger.error("Telegram API error: %s", data)
+            return []
+        
+        updates = data.get('result', [])
+        if updates:
+            self.logger.debug("Received %d Telegram updates", len(updates))
+        return updates
+    
+    def set_webhook(self, url: str, secret_token: Optional[str] = None) -> bool:
+        """Register a webhook so Telegram pushes updates instead of being polled."""
         try:
-            url = f"{self.settings.telegram_api_url}/getUpdates"
-            
-            params = {
-                'offset': offset,
-                'timeout': timeout,
-                'limit': limit
+            payload = {
+                'url': url,
+                'allowed_updates': ['message', 'callback_query']
             }
+            if secret_token:
+                payload['secret_token'] = secret_token
             
-            response = self.session.get(url, params=params, timeout=timeout + 5)
+            response = self._post_json(self._set_webhook_url, payload, 10)
             response.raise_for_status()
             
-            data = response.json()
+            self.logger.info("Telegram webhook set to %s", url)
+            return True
             
-            if data.get('ok'):
-                updates = data.get('result', [])
-                if updates:
-                    self.logger.debug(f"Received {len(updates)} Telegram updates")
-                return updates
-            else:
-                self.logger.error(f"Telegram API error: {data}")
-                return []
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to get Telegram updates: {e}")
-            return []
         except Exception as e:
-            self.logger.error(f"Unexpected error getting updates: {e}")
-            return []
+            self.logger.error("Error setting Telegram webhook: %s", e)
+            return False
+    
+    def delete_webhook(self) -> bool:
+        """Remove the webhook so updates can be polled again."""
+        try:
+            response = self._post_json(self._delete_webhook_url, {}, 10)
+            response.raise_for_status()
+            
+            self.logger.info("Telegram webhook deleted")
+            return True
+            
+        except Exception as e:
+            self.logger.error("Error deleting Telegram webhook: %s", e)
+            return False
     
-    def answer_callback_query(self, callback_query_id: str, text: str = "") -> bool:
+    async def answer_callback_query_async(self, callback_query_id: str, text: str = "") -> bool:
         """Answer callback query to remove loading state."""
         try:
-            url = f"{self.settings.telegram_api_url}/answerCallbackQuery"
+            url = self._answer_callback_url
             
             payload = {
                 'callback_query_id': callback_query_id,
                 'text': text
             }
             
-            response = self.session.post(url, json=payload, timeout=10)
-            response.raise_for_status()
+            await self._post_json_async(url, payload, 10)
             
             self.logger.debug("Callback query answered successfully")
             return True
             
         except Exception as e:
-            self.logger.error(f"Error answering callback query: {e}")
+            self.logger.error("Error answering callback query: %s", e)
             return False
     
     def create_inline_keyboard(self, buttons: List[List[Dict[str, str]]]) -> Dict:
@@ -128,7 +217,7 @@ class TelegramService:
         }
         return keyboard
     
-    def send_command_menu(self) -> bool:
+    async def send_command_menu_async(self) -> bool:
         """Send inline keyboard with command buttons."""
         try:
             keyboard = self.create_command_menu()
@@ -147,7 +236,7 @@ Welcome! Use the buttons below to interact with your Hyperliquid account:
 👇 *Select a command:*
             """.strip()
             
-            success = self.send_message(message, reply_markup=keyboard)
+            success = await self.send_message_async(message, reply_markup=keyboard)
             
             if success:
                 self.logger.info("Inline command menu sent successfully")
@@ -157,10 +246,10 @@ Welcome! Use the buttons below to interact with your Hyperliquid account:
             return success
             
         except Exception as e:
-            self.logger.error(f"Error sending inline command menu: {e}")
+            self.logger.error("Error sending inline command menu: %s", e)
             return False
     
-    def send_help_message(self, price_symbols: List[str], refresh_interval: int) -> bool:
+    async def send_help_message_async(self, price_symbols: Sequence[str], refresh_interval: int) -> bool:
         """Send help message."""
         help_text = f"""
 🤖 *Hyperliquid Bot Commands*
@@ -179,7 +268,7 @@ Welcome! Use the buttons below to interact with your Hyperliquid account:
 💡 *Note*: This bot provides both scheduled updates and on-demand data from your Hyperliquid account.
         """.strip()
         
-        success = self.send_message(help_text)
+        success = await self.send_message_async(help_text)
         if success:
             self.logger.info("Help message sent successfully")
         else:
@@ -200,14 +289,24 @@ Welcome! Use the buttons below to interact with your Hyperliquid account:
                 self.logger.info("Telegram API connectivity test passed")
                 return True
             else:
-                self.logger.warning(f"Telegram API returned status: {response.status_code}")
+                self.logger.warning("Telegram API returned status: %s", response.status_code)
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Telegram API connectivity test failed: {e}")
+            self.logger.error("Telegram API connectivity test failed: %s", e)
             return False
     
+    async def test_connectivity_async(self) -> bool:
+        """Test Telegram API connectivity without blocking the event loop."""
+        return await asyncio.to_thread(self.test_connectivity)
+    
     def close(self) -> None:
         """Close the session."""
         self.session.close()
         self.logger.debug("Telegram service session closed")
+    
+    async def aclose(self) -> None:
+        """Close the long-polling session."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+            self.logger.debug("Telegram long-polling session closed")
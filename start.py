@@ -71,8 +71,8 @@ class HyperliquidStarter:
         self.print_step("Checking Python version...")
         
         version = sys.version_info
-        if version.major < 3 or (version.major == 3 and version.minor < 8):
-            self.print_error(f"Python 3.8+ required, found {version.major}.{version.minor}")
+        if version.major < 3 or (version.major == 3 and version.minor < 10):
+            self.print_error(f"Python 3.10+ required, found {version.major}.{version.minor}")
             sys.exit(1)
         
         self.print_success(f"Python {version.major}.{version.minor}.{version.micro} detected")
@@ -252,13 +252,6 @@ class HyperliquidStarter:
             # Remove PYTHONHOME if it exists (can interfere with venv)
             env.pop("PYTHONHOME", None)
             
-            # Add src to Python path
-            src_path = str(self.project_root / "src")
-            if "PYTHONPATH" in env:
-                env["PYTHONPATH"] = f"{src_path}{os.pathsep}{env['PYTHONPATH']}"
-            else:
-                env["PYTHONPATH"] = src_path
-            
             print("   Virtual environment activated")
             print(f"   Using Python: {self.venv_python}")
             print()
@@ -337,13 +330,6 @@ class HyperliquidStarter:
             # Remove PYTHONHOME if it exists (can interfere with venv)
             env.pop("PYTHONHOME", None)
             
-            # Add src to Python path
-            src_path = str(self.project_root / "src")
-            if "PYTHONPATH" in env:
-                env["PYTHONPATH"] = f"{src_path}{os.pathsep}{env['PYTHONPATH']}"
-            else:
-                env["PYTHONPATH"] = src_path
-            
             # Change to project directory
             os.chdir(self.project_root)
             